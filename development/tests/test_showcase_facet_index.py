@@ -0,0 +1,103 @@
+"""Tests for the showcase's explorer facet bitsets"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'tools'))
+
+from habu_mcp_showcase import ToolFacetIndex, count_bits
+
+
+class Catalog:
+    def __init__(self, records):
+        self.records = records
+
+    def lookup(self, tool_name):
+        return self.records.get(tool_name, {})
+
+
+CATEGORIES = {
+    "Foundation Tools (3)": ["test_connection", "create_aws_s3_connection", "start_clean_room_creation_wizard"],
+    "Monitoring (2)": ["monitor_cleanroom_health", "create_aws_s3_connection"]
+}
+CATALOG = Catalog({
+    'test_connection': {'description': 'Check OAuth2 credentials', 'key_features': []},
+    'create_aws_s3_connection': {'description': 'Connect an AWS bucket', 'key_features': ['Bulk Operations']},
+    'start_clean_room_creation_wizard': {'description': 'Interactive setup', 'key_features': ['Step-by-step']},
+    'monitor_cleanroom_health': {'description': 'Real-time status checks', 'key_features': ['Webhooks']}
+})
+
+
+def tools_in(index, bits):
+    return [entry for position, entry in enumerate(index.entries) if bits >> position & 1]
+
+
+class TestToolFacetIndex:
+    def test_facet_bits_follow_entry_order(self):
+        index = ToolFacetIndex(CATEGORIES, CATALOG)
+
+        assert len(index.entries) == 5
+        assert index.all_bits == 0b11111
+        assert index.facets['category'] == {"Foundation Tools (3)": 0b00111, "Monitoring (2)": 0b11000}
+        # A tool listed in two categories sets one bit per entry
+        assert index.bits_for(['create_aws_s3_connection']) == 0b10010
+
+    def test_text_facets_match_name_description_and_features(self):
+        index = ToolFacetIndex(CATEGORIES, CATALOG)
+
+        assert tools_in(index, index.facets['feature']['Wizards']) == [
+            ("Foundation Tools (3)", "start_clean_room_creation_wizard")]
+        assert index.facets['feature']['Authentication'] == 0b00001
+        assert index.facets['api']['OAuth2'] == 0b00001
+        assert index.facets['api']['Real-time'] == index.facets['api']['Webhooks'] == 0b01000
+        assert index.facets['provider']['AWS'] == 0b10010
+
+    def test_combine_ands_active_masks(self):
+        index = ToolFacetIndex(CATEGORIES, CATALOG)
+        masks = {
+            'search': None,
+            'category': index.facets['category']["Foundation Tools (3)"],
+            'provider': index.any_of('provider', ['AWS'])
+        }
+
+        assert index.combine(masks) == 0b00010
+        assert index.combine({'search': None, 'category': None}) == index.all_bits
+
+    def test_combine_skip_leaves_one_facet_out(self):
+        index = ToolFacetIndex(CATEGORIES, CATALOG)
+        masks = {
+            'category': index.facets['category']["Monitoring (2)"],
+            'provider': index.any_of('provider', ['AWS'])
+        }
+
+        assert index.combine(masks, skip='category') == 0b10010
+        assert index.combine(masks, skip='provider') == 0b11000
+
+    def test_any_of_ors_selected_options(self):
+        index = ToolFacetIndex(CATEGORIES, CATALOG)
+
+        assert index.any_of('api', []) is None
+        assert index.any_of('api', ['OAuth2', 'Webhooks']) == 0b01001
+
+    def test_facet_counts_are_popcounts_of_the_other_facets(self):
+        index = ToolFacetIndex(CATEGORIES, CATALOG)
+        masks = {'category': index.facets['category']["Monitoring (2)"], 'feature': None}
+        other_bits = index.combine(masks, skip='feature')
+
+        counts = {feature: count_bits(other_bits & bits) for feature, bits in index.facets['feature'].items()}
+        assert counts['Monitoring'] == 1
+        assert counts['Cloud'] == 1
+        assert counts['Wizards'] == 0
+
+    def test_status_bits_default_to_untested_and_are_cached_per_fingerprint(self):
+        index = ToolFacetIndex(CATEGORIES, CATALOG)
+        snapshot = SimpleNamespace(fingerprint='a', status_lookup={
+            'test_connection': {'status_category': 'verified'},
+            'create_aws_s3_connection': {'status_category': 'issue'}
+        })
+
+        bits = index.status_bits(snapshot)
+        assert bits == {'verified': 0b00001, 'partial': 0, 'issue': 0b10010, 'untested': 0b01100}
+        assert index.status_bits(SimpleNamespace(fingerprint='a', status_lookup={})) is bits
+        assert index.status_bits(SimpleNamespace(fingerprint='b', status_lookup={}))['untested'] == index.all_bits
@@ -0,0 +1,60 @@
+"""Tests for the showcase's shared-cache memory ledger"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'tools'))
+
+from habu_mcp_showcase import MemoryLedger
+
+
+def noop():
+    pass
+
+
+class TestMemoryLedger:
+    def test_entries_below_max_entries_are_kept(self):
+        ledger = MemoryLedger()
+        for key in 'abc':
+            ledger.add('frames', key, 100, noop, max_entries=4)
+
+        caches, _, _ = ledger.report()
+        assert caches['frames'] == (3, 300)
+        assert ledger.bytes == 300
+
+    def test_entries_past_max_entries_drop_the_oldest(self):
+        ledger = MemoryLedger()
+        for key in 'abc':
+            ledger.add('frames', key, 100, noop, max_entries=2)
+
+        assert [key for _, key in ledger.entries] == ['b', 'c']
+        assert ledger.bytes == 200
+
+    def test_max_entries_only_counts_the_same_cache(self):
+        ledger = MemoryLedger()
+        ledger.add('figures', 'x', 50, noop)
+        ledger.add('frames', 'a', 100, noop, max_entries=1)
+        ledger.add('frames', 'b', 100, noop, max_entries=1)
+
+        assert list(ledger.entries) == [('figures', 'x'), ('frames', 'b')]
+        assert ledger.bytes == 150
+
+    def test_readding_a_key_replaces_its_size(self):
+        ledger = MemoryLedger()
+        ledger.add('frames', 'a', 100, noop, max_entries=2)
+        ledger.add('frames', 'a', 40, noop, max_entries=2)
+
+        assert ledger.report()[0]['frames'] == (1, 40)
+        assert ledger.bytes == 40
+
+    def test_enforce_evicts_least_recently_used_over_the_cap(self):
+        evicted = []
+        ledger = MemoryLedger(max_bytes=250)
+        for key in 'abc':
+            ledger.add('frames', key, 100, lambda key=key: evicted.append(key))
+        ledger.touch('frames', 'a')
+        ledger.enforce()
+
+        assert evicted == ['b']
+        assert ledger.bytes == 200
+        assert ledger.evictions == 1
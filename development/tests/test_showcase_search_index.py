@@ -0,0 +1,73 @@
+"""Tests for the showcase's explorer search index"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'tools'))
+
+from habu_mcp_showcase import ToolSearchIndex
+
+
+class Catalog:
+    def __init__(self, records):
+        self.records = records
+
+    def lookup(self, tool_name):
+        return self.records.get(tool_name, {})
+
+
+def build_index():
+    catalog = Catalog({
+        'list_cleanrooms': {
+            'description': 'List every clean room the user can access',
+            'key_features': ['Status filtering'],
+            'primary_api_calls': ['GET /cleanrooms']
+        },
+        'create_aws_s3_connection': {
+            'description': 'Create a data connection to an S3 bucket',
+            'key_features': ['IAM role setup'],
+            'primary_api_calls': ['POST /data-connections']
+        },
+        'monitor_cleanroom_health': {
+            'description': 'Report the health of a cleanroom',
+            'key_features': ['Connection status'],
+            'primary_api_calls': []
+        }
+    })
+    return ToolSearchIndex(list(catalog.records), catalog)
+
+
+class TestToolSearchIndex:
+    def test_empty_query_returns_none(self):
+        index = build_index()
+
+        assert index.search('') is None
+        assert index.search(' -_ ') is None
+
+    def test_tokens_match_by_prefix(self):
+        index = build_index()
+
+        assert set(index.search('clean')) == {'list_cleanrooms', 'monitor_cleanroom_health'}
+
+    def test_every_query_token_must_match(self):
+        index = build_index()
+
+        assert set(index.search('cleanroom health')) == {'monitor_cleanroom_health'}
+        assert index.search('cleanroom bucket') == {}
+
+    def test_scores_use_the_best_field_per_token(self):
+        index = build_index()
+
+        # name (4) beats description (2); a token in several fields counts once
+        assert index.search('connection') == {'create_aws_s3_connection': 4, 'monitor_cleanroom_health': 1}
+        assert index.search('list access') == {'list_cleanrooms': 6}
+
+    def test_query_is_case_and_punctuation_insensitive(self):
+        index = build_index()
+
+        assert index.search('AWS_S3') == index.search('aws s3') == {'create_aws_s3_connection': 8}
+
+    def test_unknown_token_matches_nothing(self):
+        index = build_index()
+
+        assert index.search('snowflake') == {}
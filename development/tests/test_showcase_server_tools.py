@@ -0,0 +1,89 @@
+"""Tests for the showcase's static extraction of the MCP server's ListTools handler"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'tools'))
+
+from habu_mcp_showcase import extract_server_tools, split_js_literal
+
+SERVER_SOURCE = r"""
+const shared = { name: 'shared_tool' };
+
+server.setRequestHandler(ListToolsRequestSchema, async () => {
+  return {
+    tools: [
+      {
+        name: 'list_cleanrooms',
+        // A comment with a comma, and a brace }
+        description: 'List clean rooms, ' +
+          "including \"archived\" ones",
+        inputSchema: {
+          type: 'object',
+          properties: {
+            status: { type: 'string', description: `Filter: {active, archived}` },
+            limit: { type: "number" }
+          },
+          required: ['status']
+        }
+      },
+      shared,
+      ...extraTools,
+      {
+        name: 'test_connection',
+        inputSchema: { type: 'object', properties: {} },
+      },
+    ]
+  };
+});
+"""
+
+
+def spans(source, start):
+    return [source[entry_start:entry_end].strip() for entry_start, entry_end in split_js_literal(source, start)]
+
+
+class TestSplitJsLiteral:
+    def test_top_level_entries_of_an_array(self):
+        assert spans("[1, [2, 3], {a: 4}]", 0) == ['1', '[2, 3]', '{a: 4}']
+
+    def test_delimiters_in_strings_and_comments_do_not_split(self):
+        source = "{a: 'x, }', b: \"]\", /* , */ c: `{`, // ,\n d: 1}"
+
+        assert spans(source, 0) == ["a: 'x, }'", 'b: "]"', '/* , */ c: `{`', '// ,\n d: 1']
+
+    def test_trailing_comma_adds_no_empty_entry(self):
+        assert spans("[1, 2, ]", 0) == ['1', '2']
+        assert spans("{}", 0) == []
+
+    def test_starts_at_the_given_offset(self):
+        source = "x = [1, 2]; y = [3]"
+
+        assert spans(source, source.index('[', 5)) == ['3']
+
+    def test_unterminated_literal_raises(self):
+        with pytest.raises(ValueError):
+            split_js_literal("[1, {2", 0)
+
+
+class TestExtractServerTools:
+    def test_inline_tools_are_described(self):
+        tools = extract_server_tools(SERVER_SOURCE)
+
+        assert [tool['name'] for tool in tools] == ['list_cleanrooms', 'test_connection']
+        assert tools[0]['description'] == 'List clean rooms, including "archived" ones'
+        assert tools[0]['parameters'] == [
+            {'name': 'status', 'type': 'string', 'description': 'Filter: {active, archived}', 'required': True},
+            {'name': 'limit', 'type': 'number', 'description': '', 'required': False}
+        ]
+
+    def test_missing_fields_get_defaults(self):
+        tool = extract_server_tools(SERVER_SOURCE)[1]
+
+        assert tool == {'name': 'test_connection', 'description': '', 'parameters': []}
+
+    def test_missing_handler_raises(self):
+        with pytest.raises(ValueError):
+            extract_server_tools("const tools = [];")
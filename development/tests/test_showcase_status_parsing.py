@@ -0,0 +1,98 @@
+"""Tests for the showcase's incremental parsing of MCP_TOOL_TESTING_STATUS.md"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'tools'))
+
+from habu_mcp_showcase import content_hash, parse_incrementally, split_status_content
+
+STATUS_CONTENT = """# MCP Tool Testing Status
+
+| Tool | Status | Issues | Priority |
+|------|--------|--------|----------|
+| test_connection | ✅ Working | - | High |
+| list_cleanrooms | ❌ Broken | Timeout | High |
+
+Summary after the table | not a row
+
+### 🔧 **test_connection**
+**Status**: ✅ Verified
+
+### 🔧 **list_cleanrooms**
+**Status**: CRITICAL
+"""
+
+
+class TestSplitStatusContent:
+    def test_rows_stop_at_the_end_of_the_table(self):
+        rows, _ = split_status_content(STATUS_CONTENT)
+
+        assert rows == [
+            '| test_connection | ✅ Working | - | High |',
+            '| list_cleanrooms | ❌ Broken | Timeout | High |'
+        ]
+
+    def test_sections_run_to_the_next_header(self):
+        _, sections = split_status_content(STATUS_CONTENT)
+
+        assert sections == [
+            '### 🔧 **test_connection**\n**Status**: ✅ Verified\n\n',
+            '### 🔧 **list_cleanrooms**\n**Status**: CRITICAL\n'
+        ]
+
+    def test_missing_table_and_sections(self):
+        assert split_status_content("# Nothing tested yet\n") == ([], [])
+
+
+class TestParseIncrementally:
+    def test_unchanged_items_reuse_cached_records(self):
+        parsed = []
+
+        def parser(item):
+            parsed.append(item)
+            return {'item': item}
+
+        cache = {}
+        parse_incrementally(['a', 'b'], parser, cache)
+        records = parse_incrementally(['a', 'c'], parser, cache)
+
+        assert records == [{'item': 'a'}, {'item': 'c'}]
+        assert parsed == ['a', 'b', 'c']
+
+    def test_cache_keeps_only_current_items(self):
+        cache = {}
+        parse_incrementally(['a', 'b'], lambda item: {'item': item}, cache)
+        parse_incrementally(['b'], lambda item: {'item': item}, cache)
+
+        assert cache == {content_hash('b'): {'item': 'b'}}
+
+    def test_duplicate_items_are_parsed_once(self):
+        parsed = []
+
+        def parser(item):
+            parsed.append(item)
+            return {'item': item}
+
+        records = parse_incrementally(['a', 'a'], parser, {})
+
+        assert records == [{'item': 'a'}, {'item': 'a'}]
+        assert parsed == ['a']
+
+    def test_none_records_are_cached_but_not_returned(self):
+        calls = []
+
+        def parser(item):
+            calls.append(item)
+
+        cache = {}
+        assert parse_incrementally(['heading'], parser, cache) == []
+        assert parse_incrementally(['heading'], parser, cache) == []
+        assert calls == ['heading']
+
+    def test_returned_records_are_copies(self):
+        cache = {}
+        records = parse_incrementally(['a'], lambda item: {'item': item}, cache)
+        records[0]['item'] = 'changed'
+
+        assert cache[content_hash('a')] == {'item': 'a'}
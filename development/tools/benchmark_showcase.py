@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+⏱️ Habu MCP Showcase Benchmark
+Headless latency benchmark of the showcase: every page plus the common interactions
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from statistics import median
+
+import streamlit as st
+from habu_mcp_showcase import SHOWCASE_PAGES
+from streamlit.testing.v1 import AppTest
+
+SHOWCASE_APP = Path(__file__).resolve().with_name('habu_mcp_showcase.py')
+
+# (page, action) per scenario. Actions get the AppTest after the page has rendered.
+BENCHMARK_SCENARIOS = {
+    **{page: (page, None) for page in SHOWCASE_PAGES},
+    'explorer: search': ("🛠️ MCP Tools Explorer", lambda at: at.text_input(key="explorer_search").input("cleanroom")),
+    'explorer: quick filter': ("🛠️ MCP Tools Explorer", lambda at: at.button(key="quick_wizard").click()),
+    'explorer: details': ("🛠️ MCP Tools Explorer", lambda at: at.button(key="open_details").click()),
+    'dashboard: category filter': ("📊 Testing Dashboard", lambda at: at.selectbox(key="dashboard_category").select_index(1)),
+    'dashboard: status filter': ("📊 Testing Dashboard", lambda at: at.selectbox(key="dashboard_status").select_index(1)),
+    'hub: open document': ("📚 Documentation Hub", lambda at: at.button(key="README.md").click()),
+}
+BENCHMARK_REPEAT = int(os.environ.get('HABU_SHOWCASE_BENCHMARK_REPEAT', '5'))
+BENCHMARK_TIMEOUT = float(os.environ.get('HABU_SHOWCASE_BENCHMARK_TIMEOUT', '120'))
+BENCHMARK_TOLERANCE = float(os.environ.get('HABU_SHOWCASE_BENCHMARK_TOLERANCE', '0.25'))
+
+def count_elements(node):
+    """Number of rendered elements below an AppTest node"""
+    children = getattr(node, 'children', None)
+    if children is None:
+        return 1
+    return sum(count_elements(child) for child in children.values())
+
+def benchmark_scenario(page, action, repeat=BENCHMARK_REPEAT):
+    """Cold and warm rerun times (ms) of one scenario, element count and exceptions
+
+    Cold runs start from empty in-memory data caches (the on-disk parse cache
+    and catalog artifact stay, as after a server restart). Warm runs repeat
+    the same interaction in the same session.
+    """
+    def timed_run(app, cold=False):
+        if action is None:
+            app.sidebar.radio[0].set_value(page)
+        else:
+            action(app)
+        if cold:
+            app.session_state['clear_data_caches'] = True
+        started = time.perf_counter()
+        app.run()
+        return (time.perf_counter() - started) * 1000
+
+    cold = []
+    for _ in range(repeat):
+        app = AppTest.from_file(str(SHOWCASE_APP), default_timeout=BENCHMARK_TIMEOUT)
+        app.run()
+        if action is not None:
+            app.sidebar.radio[0].set_value(page)
+            app.run()
+        cold.append(timed_run(app, cold=True))
+    warm = [timed_run(app) for _ in range(repeat)]
+    return {
+        'page': page,
+        'cold_ms': [round(ms, 1) for ms in cold],
+        'warm_ms': [round(ms, 1) for ms in warm],
+        'cold_median_ms': round(median(cold), 1),
+        'warm_median_ms': round(median(warm), 1),
+        'elements': count_elements(app.sidebar) + count_elements(app.main),
+        'exceptions': [exception.value for exception in app.exception]
+    }
+
+def run_benchmark(scenarios=None, repeat=BENCHMARK_REPEAT):
+    """Benchmark report for the named scenarios (all by default), ready for json.dump"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=SHOWCASE_APP.parent,
+                                capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    results = {name: benchmark_scenario(*BENCHMARK_SCENARIOS[name], repeat=repeat)
+               for name in scenarios or BENCHMARK_SCENARIOS}
+    return {
+        'commit': commit,
+        'recorded_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'streamlit': st.__version__,
+        'repeat': repeat,
+        'scenarios': results
+    }
+
+def compare_benchmarks(report, baseline, tolerance=BENCHMARK_TOLERANCE):
+    """(name, baseline ms, current ms, regressed) per scenario present in both reports, by warm median"""
+    rows = []
+    for name, result in report['scenarios'].items():
+        previous = baseline.get('scenarios', {}).get(name)
+        if previous:
+            before, after = previous['warm_median_ms'], result['warm_median_ms']
+            rows.append((name, before, after, after > before * (1 + tolerance)))
+    return rows
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Habu MCP Showcase Benchmark")
+    parser.add_argument('report', metavar='JSON',
+                        help="where to write the benchmark report")
+    parser.add_argument('--baseline', metavar='JSON',
+                        help="compare against an earlier report and exit 1 on a regression")
+    parser.add_argument('--scenario', action='append', choices=list(BENCHMARK_SCENARIOS),
+                        help="only run this scenario (repeatable)")
+    parser.add_argument('--repeat', type=int, default=BENCHMARK_REPEAT,
+                        help=f"cold and warm runs per scenario (default {BENCHMARK_REPEAT})")
+    args = parser.parse_args()
+    # AppTest runs the showcase as __main__ with this process's arguments; it
+    # only reads its own options, none of which these abbreviate
+    report = run_benchmark(args.scenario, args.repeat)
+    Path(args.report).write_text(json.dumps(report, indent=2, ensure_ascii=False))
+    print(f"{'scenario':<32}{'cold ms':>10}{'warm ms':>10}{'elements':>10}")
+    for name, result in report['scenarios'].items():
+        print(f"{name:<32}{result['cold_median_ms']:>10.1f}{result['warm_median_ms']:>10.1f}{result['elements']:>10}"
+              + (f"  ERROR: {result['exceptions'][0]}" if result['exceptions'] else ""))
+    failed = any(result['exceptions'] for result in report['scenarios'].values())
+    if args.baseline:
+        print()
+        for name, before, after, regressed in compare_benchmarks(report, json.loads(Path(args.baseline).read_text())):
+            print(f"{name:<32}{before:>10.1f} -> {after:>8.1f} ms" + ("  REGRESSION" if regressed else ""))
+            failed = failed or regressed
+    sys.exit(1 if failed else 0)
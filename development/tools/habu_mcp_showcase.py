@@ -5,25 +5,31 @@ Interactive Streamlit app to explore the comprehensive MCP Server for Habu Clean
 """
 
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from pathlib import Path
 import re
 from datetime import datetime
 import json
+import atexit
+import functools
 import hashlib
+import os
+import sqlite3
+import struct
+import sys
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from types import FunctionType, MappingProxyType, ModuleType
 
-# Page config
-st.set_page_config(
-    page_title="Habu MCP Server Project Overview",
-    page_icon="🚀",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # Fall back to stat polling when watchdog is unavailable
+    FileSystemEventHandler = object
+    Observer = None
 
 # Force sidebar to stay open and improve styling
-st.markdown("""
+SIDEBAR_CSS = """
 <style>
     /* Keep sidebar always visible and properly sized */
     .sidebar .sidebar-content {
@@ -96,10 +102,10 @@ st.markdown("""
         box-shadow: 0 2px 4px rgba(255, 75, 75, 0.2);
     }
 </style>
-""", unsafe_allow_html=True)
+"""
 
 # Custom CSS for better styling
-st.markdown("""
+SHOWCASE_CSS = """
 <style>
     .main-header {
         font-size: 3rem;
@@ -253,7 +259,23 @@ st.markdown("""
         background: linear-gradient(90deg, #e9ecef, #dee2e6);
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Heavy libraries only some pages need; imported inside those pages so cold
+# starts and the landing page skip them. Used by --import-profile.
+PAGE_IMPORTS = {
+    "📊 Testing Dashboard": ["pandas", "plotly.express", "plotly.graph_objects"],
+}
+
+def apply_page_style():
+    """Page config and shared CSS, applied at the start of each run"""
+    st.set_page_config(
+        page_title="Habu MCP Server Project Overview",
+        page_icon="🚀",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+    st.markdown(SIDEBAR_CSS + SHOWCASE_CSS, unsafe_allow_html=True)
 
 def load_markdown_file(filename):
     """Load and return contents of a markdown file"""
@@ -276,156 +298,687 @@ def clean_text_content(text):
     cleaned = cleaned.replace("</div>", "").replace("<div", "").replace("&lt;/div&gt;", "")
     return cleaned
 
-@st.cache_data(ttl=300)  # Cache for 5 minutes
+def freeze(value):
+    """Recursively convert dicts/lists into read-only mappings/tuples safe to share across sessions"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+STATUS_TABLE_HEADER = '| Tool | Status | Issues | Priority |'
+
+class StatusParseState:
+    """Parsed records for the incremental status parser
+    
+    Rows and sections are keyed by the SHA-1 of their text so unchanged content
+    is never parsed twice. The warmer and status refresh threads parse too, so
+    every access holds lock (re-entrant: the status parser nests the section
+    parser).
+    """
+    
+    def __init__(self):
+        self.rows = {}
+        self.sections = {}
+        self.last_status = {}
+        self.last_progress = {}
+        self.lock = threading.RLock()
+
+@st.cache_resource
+def get_status_parse_state():
+    """Process-wide parser state; module globals start empty on every rerun"""
+    return StatusParseState()
+
+def content_hash(text):
+    """Return the SHA-1 hex digest used to key parsed file content"""
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+def categorize_status(status_text, detailed=False):
+    """Map a status string to verified / partial / issue / untested"""
+    if '✅' in status_text or (detailed and 'Verified' in status_text):
+        return 'verified'
+    elif '🟡' in status_text or (detailed and 'Complete' in status_text):
+        return 'partial'
+    elif '❌' in status_text or (detailed and 'CRITICAL' in status_text):
+        return 'issue'
+    return 'untested'
+
+def split_status_content(content):
+    """Split MCP_TOOL_TESTING_STATUS.md into status table rows and ### sections"""
+    rows = []
+    header_at = content.find(STATUS_TABLE_HEADER)
+    if header_at != -1:
+        table_start = content.find('\n', header_at)
+        if table_start != -1:
+            for line in content[table_start + 1:].split('\n'):
+                if not line.startswith('|'):
+                    break
+                if 'Tool' not in line and '---' not in line:
+                    rows.append(line)
+    
+    # Each section runs from its "### " header to the next "### " header
+    starts = [m.start() for m in re.finditer(r'^### ', content, re.MULTILINE)]
+    sections = [content[start:end] for start, end in zip(starts, starts[1:] + [len(content)])]
+    return rows, sections
+
+# Persistent parse cache shared by every Streamlit process on the host. Entries
+# are keyed by (parser, path, size, mtime) with the content hash as fallback, so
+# replicas and restarts reuse records parsed by any other process. The parser
+# key carries a hash of this file, so records from other parsing code are
+# never served after a deploy.
+PARSE_CACHE_DIR = Path(os.environ.get('HABU_SHOWCASE_CACHE_DIR',
+                                      Path.home() / '.cache' / 'habu_mcp_showcase'))
+PARSE_CACHE_MAX_ENTRIES = int(os.environ.get('HABU_SHOWCASE_CACHE_MAX_ENTRIES', '64'))
+PARSE_CACHE_MAX_BYTES = int(os.environ.get('HABU_SHOWCASE_CACHE_MAX_BYTES', str(16 * 1024 * 1024)))
+
+# Opt-in timing spans and cache hit/miss counters (HABU_SHOWCASE_METRICS=1),
+# shown in a sidebar debug panel and written to METRICS_FILE in Prometheus
+# text format after every rerun. Disabled, the decorators return the function
+# untouched, so instrumentation costs nothing.
+METRICS_ENABLED = os.environ.get('HABU_SHOWCASE_METRICS', '') not in ('', '0')
+METRICS_FILE = Path(os.environ.get('HABU_SHOWCASE_METRICS_FILE', PARSE_CACHE_DIR / 'metrics.prom'))
+
+class Metrics:
+    """Process-wide span timings and cache lookup counters"""
+    
+    def __init__(self):
+        self.spans = {}   # name -> [calls, total seconds, max seconds, last seconds]
+        self.caches = {}  # name -> [lookups, misses]
+        self.lock = threading.Lock()
+    
+    def observe(self, name, seconds):
+        with self.lock:
+            span = self.spans.setdefault(name, [0, 0.0, 0.0, 0.0])
+            span[0] += 1
+            span[1] += seconds
+            span[2] = max(span[2], seconds)
+            span[3] = seconds
+    
+    def count(self, name, lookups=0, misses=0):
+        with self.lock:
+            counts = self.caches.setdefault(name, [0, 0])
+            counts[0] += lookups
+            counts[1] += misses
+    
+    def snapshot(self):
+        """(spans, caches) copies that are safe to read while other sessions record"""
+        with self.lock:
+            return ({name: tuple(span) for name, span in self.spans.items()},
+                    {name: tuple(counts) for name, counts in self.caches.items()})
+
+@st.cache_resource
+def get_metrics():
+    return Metrics()
+
+def timed(name):
+    """Record the wall time of every call under span name"""
+    def decorate(func):
+        if not METRICS_ENABLED:
+            return func
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                get_metrics().observe(name, time.perf_counter() - started)
+        return wrapper
+    return decorate
+
+# Memory accounting for the metered caches and sessions. With a cap set
+# (bytes across every metered cache, 0 = unlimited) the least recently used
+# entries are cleared from whichever cache holds them until the total fits.
+CACHE_MEMORY_CAP = int(os.environ.get('HABU_SHOWCASE_CACHE_MEMORY_CAP', '0'))
+SESSION_IDLE_SECONDS = float(os.environ.get('HABU_SHOWCASE_SESSION_IDLE_SECONDS', '600'))
+MEMORY_ACCOUNTING = METRICS_ENABLED or CACHE_MEMORY_CAP > 0
+
+MemoryReport = namedtuple('MemoryReport', ['caches', 'sessions', 'evictions', 'resident', 'peak_resident'])
+
+class MemoryLedger:
+    """Approximate bytes held by each shared cache entry and each live session"""
+    
+    def __init__(self, max_bytes=CACHE_MEMORY_CAP):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # (cache, key) -> (bytes, evict), least recently used first
+        self.bytes = 0
+        self.evictions = 0
+        self.sessions = {}  # session id -> (bytes, last seen)
+        self.lock = threading.Lock()
+    
+    def _remove(self, entry):
+        size, _ = self.entries.pop(entry, (0, None))
+        self.bytes -= size
+    
+    def add(self, cache, key, size, evict, max_entries=None):
+        with self.lock:
+            self._remove((cache, key))
+            self.entries[(cache, key)] = (size, evict)
+            self.bytes += size
+            if max_entries:
+                # Streamlit has already dropped this cache's oldest entries past max_entries
+                entries = [entry for entry in self.entries if entry[0] == cache]
+                excess = len(entries) - max_entries
+                if excess > 0:
+                    for entry in entries[:excess]:
+                        self._remove(entry)
+    
+    def touch(self, cache, key):
+        with self.lock:
+            if (cache, key) in self.entries:
+                self.entries.move_to_end((cache, key))
+    
+    def discard(self, cache, key=None):
+        """Forget one entry of cache, or all of them"""
+        with self.lock:
+            for entry in [entry for entry in self.entries if entry[0] == cache and key in (None, entry[1])]:
+                self._remove(entry)
+    
+    def enforce(self):
+        """Evict least recently used entries over the cap; the newest entry always stays"""
+        evicted = []
+        with self.lock:
+            while self.max_bytes and self.bytes > self.max_bytes and len(self.entries) > 1:
+                entry = next(iter(self.entries))
+                evicted.append(self.entries[entry][1])
+                self._remove(entry)
+                self.evictions += 1
+        for evict in evicted:
+            evict()
+    
+    def record_session(self, session_id, size):
+        with self.lock:
+            self.sessions[session_id] = (size, time.time())
+    
+    def report(self):
+        """({cache: (entries, bytes)}, {live session id: bytes}, evictions)"""
+        with self.lock:
+            caches = {}
+            for (cache, _), (size, _) in self.entries.items():
+                entries, total = caches.get(cache, (0, 0))
+                caches[cache] = (entries + 1, total + size)
+            cutoff = time.time() - SESSION_IDLE_SECONDS
+            self.sessions = {session_id: seen for session_id, seen in self.sessions.items() if seen[1] >= cutoff}
+            return caches, {session_id: size for session_id, (size, _) in self.sessions.items()}, self.evictions
+
+@st.cache_resource
+def get_memory_ledger():
+    return MemoryLedger()
+
+# Every metered cache, so the data caches can be emptied without touching the
+# process singletons (watcher, warmer, status store) that also live in
+# st.cache_resource
+DATA_CACHES = []
+
+def metered_cache(name, **options):
+    """st.cache_resource(**options) that also times lookups, counts misses and accounts entry sizes under name"""
+    def decorate(func):
+        if not MEMORY_ACCOUNTING:
+            cached = st.cache_resource(**options)(func)
+            DATA_CACHES.append(cached)
+            return cached
+        built = threading.local()
+        
+        @functools.wraps(func)
+        def build(*args, **kwargs):
+            if METRICS_ENABLED:
+                get_metrics().count(name, misses=1)
+            value = func(*args, **kwargs)
+            built.size = approximate_size(value)
+            return value
+        cached = st.cache_resource(**options)(build)
+        
+        @functools.wraps(func)
+        def lookup(*args, **kwargs):
+            if METRICS_ENABLED:
+                get_metrics().count(name, lookups=1)
+            built.size = None
+            value = cached(*args, **kwargs)
+            # Like Streamlit, leave _underscore arguments (e.g. the data an entry
+            # is built from) out of the key
+            key_kwargs = {arg: arg_value for arg, arg_value in kwargs.items() if not arg.startswith('_')}
+            key = (args, tuple(sorted(key_kwargs.items())))
+            ledger = get_memory_ledger()
+            if built.size is not None:
+                # Evicting goes through Streamlit so the entry is really released
+                ledger.add(name, key, built.size, lambda: cached.clear(*args, **key_kwargs), options.get('max_entries'))
+                ledger.enforce()
+            else:
+                ledger.touch(name, key)
+            return value
+        
+        def clear(*args, **kwargs):
+            key_kwargs = {arg: arg_value for arg, arg_value in kwargs.items() if not arg.startswith('_')}
+            cached.clear(*args, **key_kwargs)
+            get_memory_ledger().discard(name, (args, tuple(sorted(key_kwargs.items()))) if args or key_kwargs else None)
+        lookup.clear = clear
+        metered = timed(name)(lookup)
+        DATA_CACHES.append(metered)
+        return metered
+    return decorate
+
+def process_memory():
+    """(resident, peak resident) bytes of this process; None where the platform doesn't say"""
+    resident = peak = None
+    try:
+        with open('/proc/self/statm') as statm:
+            resident = int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+        # ru_maxrss is in kilobytes on Linux and bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == 'darwin' else 1024)
+    except ImportError:
+        pass
+    return resident, peak
+
+def record_session_memory():
+    """Account this session's state; returns its approximate size in bytes"""
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+    
+    size = approximate_size(st.session_state.to_dict())
+    ctx = get_script_run_ctx()
+    if ctx is not None:
+        get_memory_ledger().record_session(ctx.session_id, size)
+    return size
+
+def memory_snapshot():
+    """MemoryReport over the metered caches, the shared render caches and live sessions"""
+    caches, sessions, evictions = get_memory_ledger().report()
+    view_cache = get_explorer_view_cache()
+    caches['explorer_view'] = (len(view_cache.entries), view_cache.bytes)
+    return MemoryReport(caches, sessions, evictions, *process_memory())
+
+def count_cache_lookup(name, hit):
+    """Count one lookup of a hand-rolled cache"""
+    if METRICS_ENABLED:
+        get_metrics().count(name, lookups=1, misses=0 if hit else 1)
+
+def metrics_snapshot():
+    """Spans and cache counters, including the shared render caches' own counters"""
+    spans, caches = get_metrics().snapshot()
+    view_cache = get_explorer_view_cache()
+    caches['explorer_view'] = (view_cache.hits + view_cache.misses, view_cache.misses)
+    return spans, caches
+
+def prometheus_metrics(spans, caches, memory):
+    """Render spans, cache counters and memory in the Prometheus text exposition format"""
+    lines = [
+        '# HELP habu_showcase_span_seconds Wall time of instrumented pages, parsers and caches.',
+        '# TYPE habu_showcase_span_seconds summary',
+    ]
+    for name, (calls, total, _, _) in sorted(spans.items()):
+        lines.append(f'habu_showcase_span_seconds_count{{span="{name}"}} {calls}')
+        lines.append(f'habu_showcase_span_seconds_sum{{span="{name}"}} {total:.6f}')
+    lines += [
+        '# HELP habu_showcase_span_max_seconds Slowest single call per span.',
+        '# TYPE habu_showcase_span_max_seconds gauge',
+    ]
+    lines += [f'habu_showcase_span_max_seconds{{span="{name}"}} {slowest:.6f}'
+              for name, (_, _, slowest, _) in sorted(spans.items())]
+    lines += [
+        '# HELP habu_showcase_cache_lookups_total Lookups per cache.',
+        '# TYPE habu_showcase_cache_lookups_total counter',
+    ]
+    lines += [f'habu_showcase_cache_lookups_total{{cache="{name}"}} {lookups}'
+              for name, (lookups, _) in sorted(caches.items())]
+    lines += [
+        '# HELP habu_showcase_cache_misses_total Lookups per cache that had to build the value.',
+        '# TYPE habu_showcase_cache_misses_total counter',
+    ]
+    lines += [f'habu_showcase_cache_misses_total{{cache="{name}"}} {misses}'
+              for name, (_, misses) in sorted(caches.items())]
+    lines += [
+        '# HELP habu_showcase_cache_bytes Approximate bytes held per cache.',
+        '# TYPE habu_showcase_cache_bytes gauge',
+    ]
+    lines += [f'habu_showcase_cache_bytes{{cache="{name}"}} {size}' for name, (_, size) in sorted(memory.caches.items())]
+    lines += [
+        '# HELP habu_showcase_cache_entries Entries held per cache.',
+        '# TYPE habu_showcase_cache_entries gauge',
+    ]
+    lines += [f'habu_showcase_cache_entries{{cache="{name}"}} {entries}'
+              for name, (entries, _) in sorted(memory.caches.items())]
+    lines += [
+        '# HELP habu_showcase_cache_memory_evictions_total Entries evicted to stay under the cache memory cap.',
+        '# TYPE habu_showcase_cache_memory_evictions_total counter',
+        f'habu_showcase_cache_memory_evictions_total {memory.evictions}',
+        '# HELP habu_showcase_sessions Sessions seen within the idle window.',
+        '# TYPE habu_showcase_sessions gauge',
+        f'habu_showcase_sessions {len(memory.sessions)}',
+        '# HELP habu_showcase_session_bytes Approximate bytes of session state across live sessions.',
+        '# TYPE habu_showcase_session_bytes gauge',
+        f'habu_showcase_session_bytes {sum(memory.sessions.values())}',
+    ]
+    if memory.resident is not None:
+        lines += [
+            '# HELP habu_showcase_process_resident_bytes Resident memory of the server process.',
+            '# TYPE habu_showcase_process_resident_bytes gauge',
+            f'habu_showcase_process_resident_bytes {memory.resident}',
+        ]
+    return '\n'.join(lines) + '\n'
+
+def write_metrics_file(path=METRICS_FILE):
+    """Atomically replace the scrape file so readers never see a partial write"""
+    temporary = path.with_name(f'{path.name}.{threading.get_ident()}.tmp')
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary.write_text(prometheus_metrics(*metrics_snapshot(), memory_snapshot()))
+        os.replace(temporary, path)
+    except OSError:
+        pass
+
+def show_metrics_panel():
+    """Sidebar debug panel with span timings and cache hit rates"""
+    spans, caches = metrics_snapshot()
+    with st.sidebar.expander("🐞 Timings & Caches"):
+        st.dataframe([{'span': name, 'calls': calls, 'last ms': round(last * 1000, 1),
+                       'mean ms': round(total / calls * 1000, 1), 'max ms': round(slowest * 1000, 1)}
+                      for name, (calls, total, slowest, last) in sorted(spans.items(), key=lambda item: -item[1][1])],
+                     hide_index=True)
+        st.dataframe([{'cache': name, 'lookups': lookups, 'misses': misses,
+                       'hit rate': f"{(lookups - misses) / lookups:.0%}" if lookups else "-"}
+                      for name, (lookups, misses) in sorted(caches.items())],
+                     hide_index=True)
+        st.caption(f"Scrape file: {METRICS_FILE}")
+    
+    session_bytes = record_session_memory()
+    memory = memory_snapshot()
+    with st.sidebar.expander("🧮 Memory"):
+        shared_bytes = sum(size for _, size in memory.caches.values())
+        st.dataframe([{'cache': name, 'entries': entries, 'KB': round(size / 1024, 1),
+                       'share': f"{size / shared_bytes:.0%}" if shared_bytes else "-"}
+                      for name, (entries, size) in sorted(memory.caches.items(), key=lambda item: -item[1][1])],
+                     hide_index=True)
+        sessions = memory.sessions or {None: session_bytes}
+        st.markdown(f"""
+**Shared caches:** {shared_bytes / 1024 / 1024:.1f} MB
+{f"(cap {CACHE_MEMORY_CAP / 1024 / 1024:.1f} MB, {memory.evictions} evicted)" if CACHE_MEMORY_CAP else "(no cap)"}  
+**This session:** {session_bytes / 1024:.1f} KB  
+**Live sessions:** {len(sessions)}, {sum(sessions.values()) / len(sessions) / 1024:.1f} KB mean, {max(sessions.values()) / 1024:.1f} KB max  
+**Process RSS:** {f"{memory.resident / 1024 / 1024:.0f} MB" if memory.resident else "n/a"}
+{f"(peak {memory.peak_resident / 1024 / 1024:.0f} MB)" if memory.peak_resident else ""}
+""")
+        st.caption("Sizes are approximate: object graphs are walked once, shared objects counted once per entry.")
+
+def open_parse_cache():
+    """Open (and create if needed) the on-disk parse cache database"""
+    PARSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(PARSE_CACHE_DIR / 'parse_cache.sqlite3', timeout=5)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS parse_cache (
+            parser TEXT NOT NULL,
+            content_hash TEXT NOT NULL,
+            path TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            payload TEXT NOT NULL,
+            last_access REAL NOT NULL,
+            PRIMARY KEY (parser, content_hash)
+        )
+    """)
+    conn.execute('CREATE INDEX IF NOT EXISTS parse_cache_stat ON parse_cache (parser, path, size, mtime_ns)')
+    return conn
+
+def evict_parse_cache(conn):
+    """Evict least recently used entries beyond the entry and byte limits"""
+    conn.execute("""
+        DELETE FROM parse_cache WHERE rowid IN (
+            SELECT rowid FROM parse_cache ORDER BY last_access DESC LIMIT -1 OFFSET ?
+        )
+    """, (PARSE_CACHE_MAX_ENTRIES,))
+    conn.execute("""
+        DELETE FROM parse_cache WHERE rowid IN (
+            SELECT rowid FROM (
+                SELECT rowid, SUM(LENGTH(payload)) OVER (ORDER BY last_access DESC) AS running
+                FROM parse_cache
+            ) WHERE running > ?
+        )
+    """, (PARSE_CACHE_MAX_BYTES,))
+
+def parser_source_hash():
+    """Hash of the showcase source the parsers are defined in"""
+    return content_hash(Path(__file__).read_text(encoding='utf-8'))
+
+def load_parsed_file(filename, parser_name, parse_content):
+    """Return parse_content(file content), served from the on-disk cache when possible"""
+    file_path = Path(filename)
+    if not file_path.exists():
+        return parse_content(load_markdown_file(filename))
+    
+    path = str(file_path.resolve())
+    stat = file_path.stat()
+    try:
+        parser = f"{parser_name}:{parser_source_hash()}"
+        conn = open_parse_cache()
+        try:
+            with conn:
+                # Fast path: same file, untouched since it was cached
+                row = conn.execute(
+                    'SELECT content_hash, payload FROM parse_cache WHERE parser = ? AND path = ? AND size = ? AND mtime_ns = ?',
+                    (parser, path, stat.st_size, stat.st_mtime_ns)
+                ).fetchone()
+                if row is not None:
+                    conn.execute('UPDATE parse_cache SET last_access = ? WHERE parser = ? AND content_hash = ?',
+                                 (time.time(), parser, row[0]))
+                    count_cache_lookup('parse_cache', hit=True)
+                    return json.loads(row[1])
+                
+                # Same content under a new mtime (restart, redeploy) or a genuine change
+                content = load_markdown_file(filename)
+                file_hash = content_hash(content)
+                row = conn.execute('SELECT payload FROM parse_cache WHERE parser = ? AND content_hash = ?',
+                                   (parser, file_hash)).fetchone()
+                count_cache_lookup('parse_cache', hit=row is not None)
+                records = json.loads(row[0]) if row else parse_content(content)
+                conn.execute(
+                    'INSERT OR REPLACE INTO parse_cache VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    (parser, file_hash, path, stat.st_size, stat.st_mtime_ns,
+                     row[0] if row else json.dumps(records), time.time())
+                )
+                evict_parse_cache(conn)
+                return records
+        finally:
+            conn.close()
+    except (sqlite3.Error, OSError):
+        # An unusable cache (read-only disk, locked database) must never break the page
+        return parse_content(load_markdown_file(filename))
+
+def parse_status_row(line):
+    """Parse one row of the tool status table"""
+    parts = [p.strip() for p in line.split('|')[1:-1]]  # Remove empty first/last
+    if len(parts) < 3:
+        return None
+    return {
+        'name': parts[0],
+        'status': parts[1],
+        'status_category': categorize_status(parts[1]),
+        'issues': parts[2],
+        'priority': parts[3] if len(parts) > 3 else "-"
+    }
+
+def parse_tool_section(section):
+    """Parse a single "### **tool_name**" report section"""
+    header, _, body = section.partition('\n')
+    # Look for tool headers like "### 🔧 **create_bigquery_connection_wizard**"
+    match = re.search(r'\*\*([^*]+)\*\*', header)
+    if not match:
+        return None
+    tool = {
+        'name': match.group(1),
+        'detailed_status': '',
+        'working_components': [],
+        'current_issues': [],
+        'technical_details': '',
+        'next_steps': []
+    }
+    for line in body.split('\n'):
+        if line.startswith('**Status**:'):
+            status_text = line.replace('**Status**:', '').strip()
+            tool['detailed_status'] = status_text
+            tool['status_category'] = categorize_status(status_text, detailed=True)
+    return tool
+
+def parse_incrementally(items, parser, cache):
+    """Parse items, reusing cached records for any item whose hash is unchanged
+    
+    cache is updated in place; callers sharing it hold the parse state lock.
+    """
+    records = []
+    seen = {}
+    for item in items:
+        key = content_hash(item)
+        if key in seen:
+            record = seen[key]
+        elif key in cache:
+            record = cache[key]
+        else:
+            record = parser(item)
+        seen[key] = record
+        if record is not None:
+            records.append(dict(record))
+    # Drop records for rows/sections that no longer exist in the file
+    cache.clear()
+    cache.update(seen)
+    return records
+
+@timed('parse_tool_testing_status')
 def parse_tool_testing_status():
     """Parse the MCP_TOOL_TESTING_STATUS.md file to extract tool status"""
-    content = load_markdown_file("MCP_TOOL_TESTING_STATUS.md")
-    
-    # Extract tool status table
-    tools = []
-    lines = content.split('\n')
-    in_table = False
-    
-    for line in lines:
-        if '| Tool | Status | Issues | Priority |' in line:
-            in_table = True
-            continue
-        elif in_table and line.startswith('|') and 'Tool' not in line and '---' not in line:
-            parts = [p.strip() for p in line.split('|')[1:-1]]  # Remove empty first/last
-            if len(parts) >= 3:
-                tool_name = parts[0]
-                status = parts[1]
-                issues = parts[2]
-                priority = parts[3] if len(parts) > 3 else "-"
-                
-                # Determine status category
-                if '✅' in status:
-                    status_cat = 'verified'
-                elif '🟡' in status:
-                    status_cat = 'partial'
-                elif '❌' in status:
-                    status_cat = 'issue'
-                else:
-                    status_cat = 'untested'
-                
+    return freeze(load_parsed_file("MCP_TOOL_TESTING_STATUS.md", "tool_testing_status",
+                                   parse_tool_testing_status_content))
+
+def parse_tool_testing_status_content(content):
+    """Extract tool status records from MCP_TOOL_TESTING_STATUS.md content"""
+    state = get_status_parse_state()
+    with state.lock:
+        file_hash = content_hash(content)
+        if state.last_status.get('hash') == file_hash:
+            return [dict(tool) for tool in state.last_status['tools']]
+        
+        rows, sections = split_status_content(content)
+        tools = parse_incrementally(rows, parse_status_row, state.rows)
+        
+        # Merge detailed tool reports into table data through a name index
+        tool_index = {}
+        for i, tool in enumerate(tools):
+            tool_index.setdefault(tool['name'], i)
+        for detailed_tool in parse_detailed_tool_reports(content, sections):
+            i = tool_index.get(detailed_tool['name'])
+            if i is None:
+                # Report-only tools still need the fields the table rows carry
+                tool_index[detailed_tool['name']] = len(tools)
                 tools.append({
-                    'name': tool_name,
-                    'status': status,
-                    'status_category': status_cat,
-                    'issues': issues,
-                    'priority': priority
+                    'status': detailed_tool['detailed_status'] or 'Not Tested',
+                    'status_category': 'untested',
+                    'issues': '-',
+                    'priority': '-',
+                    **detailed_tool
                 })
-        elif in_table and not line.startswith('|'):
-            break
-    
-    # Also parse detailed tool reports for more comprehensive status
-    detailed_tools = parse_detailed_tool_reports(content)
-    
-    # Merge with table data
-    for detailed_tool in detailed_tools:
-        # Check if tool already in table data
-        found = False
-        for i, tool in enumerate(tools):
-            if tool['name'] == detailed_tool['name']:
+            else:
                 tools[i].update(detailed_tool)
-                found = True
-                break
-        if not found:
-            tools.append(detailed_tool)
-    
-    return tools
+        
+        state.last_status.update(hash=file_hash, tools=[dict(tool) for tool in tools])
+        return tools
 
-def parse_detailed_tool_reports(content):
+def parse_detailed_tool_reports(content, sections=None):
     """Parse detailed tool reports from MCP_TOOL_TESTING_STATUS.md"""
-    tools = []
-    lines = content.split('\n')
-    
-    current_tool = None
-    in_tool_section = False
-    
-    for line in lines:
-        # Look for tool headers like "### 🔧 **create_bigquery_connection_wizard**"
-        if line.startswith('### ') and '**' in line:
-            # Extract tool name
-            match = re.search(r'\*\*([^*]+)\*\*', line)
-            if match:
-                tool_name = match.group(1)
-                current_tool = {
-                    'name': tool_name,
-                    'detailed_status': '',
-                    'working_components': [],
-                    'current_issues': [],
-                    'technical_details': '',
-                    'next_steps': []
-                }
-                in_tool_section = True
-        
-        elif in_tool_section and current_tool:
-            # Parse status line
-            if line.startswith('**Status**:'):
-                status_text = line.replace('**Status**:', '').strip()
-                current_tool['detailed_status'] = status_text
-                
-                # Determine category from detailed status
-                if '✅' in status_text or 'Verified' in status_text:
-                    current_tool['status_category'] = 'verified'
-                elif '🟡' in status_text or 'Complete' in status_text:
-                    current_tool['status_category'] = 'partial'
-                elif '❌' in status_text or 'CRITICAL' in status_text:
-                    current_tool['status_category'] = 'issue'
-                else:
-                    current_tool['status_category'] = 'untested'
-            
-            # Parse working components
-            elif '#### ✅ **Working Components:**' in line:
-                section = 'working'
-            elif '#### ❌ **Current Issues:**' in line:
-                section = 'issues'
-            elif '#### 🔍 **Technical Details:**' in line:
-                section = 'technical'
-            elif '#### 🎯 **Next Steps:**' in line:
-                section = 'next_steps'
-            elif line.startswith('### ') and current_tool:
-                # End of current tool section
-                tools.append(current_tool)
-                in_tool_section = False
-                current_tool = None
-    
-    # Add last tool if we were processing one
-    if current_tool:
-        tools.append(current_tool)
-    
-    return tools
+    state = get_status_parse_state()
+    with state.lock:
+        if sections is None:
+            _, sections = split_status_content(content)
+        return parse_incrementally(sections, parse_tool_section, state.sections)
 
-@st.cache_data(ttl=300)  # Cache for 5 minutes
+@timed('parse_testing_progress')
 def parse_testing_progress():
     """Parse TESTING_PROGRESS.md for completed tests"""
-    content = load_markdown_file("TESTING_PROGRESS.md")
-    
-    # Extract completed tests
-    completed_tools = []
-    lines = content.split('\n')
-    
-    for line in lines:
-        if '**`' in line and ('✅' in line or 'VALIDATED' in line):
-            # Extract tool name from **`tool_name`**
-            match = re.search(r'\*\*`([^`]+)`\*\*', line)
-            if match:
-                tool_name = match.group(1)
-                status = "✅ Verified" if '✅' in line else "✅ Validated"
-                completed_tools.append({
-                    'name': tool_name,
-                    'status': status,
-                    'details': line.strip()
-                })
+    return freeze(load_parsed_file("TESTING_PROGRESS.md", "testing_progress",
+                                   parse_testing_progress_content))
+
+def parse_testing_progress_content(content):
+    """Extract completed tests from TESTING_PROGRESS.md content"""
+    state = get_status_parse_state()
+    with state.lock:
+        file_hash = content_hash(content)
+        if state.last_progress.get('hash') == file_hash:
+            return [dict(tool) for tool in state.last_progress['tools']]
+        
+        # Extract completed tests, only visiting lines that mention a **`tool`**
+        completed_tools = []
+        for match in re.finditer(r'^.*\*\*`.*$', content, re.MULTILINE):
+            line = match.group(0)
+            if '✅' in line or 'VALIDATED' in line:
+                # Extract tool name from **`tool_name`**
+                name_match = re.search(r'\*\*`([^`]+)`\*\*', line)
+                if name_match:
+                    status = "✅ Verified" if '✅' in line else "✅ Validated"
+                    completed_tools.append({
+                        'name': name_match.group(1),
+                        'status': status,
+                        'details': line.strip()
+                    })
+        
+        state.last_progress.update(hash=file_hash, tools=[dict(tool) for tool in completed_tools])
+        return completed_tools
+
+class FileInfoCache:
+    """File metadata by path and *.md counts by directory, recomputed only when mtime or size change"""
     
-    return completed_tools
+    def __init__(self):
+        self.metadata = {}        # path -> ((mtime_ns, size), info)
+        self.markdown_counts = {}  # directory -> (mtime_ns, count)
+
+@st.cache_resource
+def get_file_info_cache():
+    """Process-wide file info; module globals start empty on every rerun"""
+    return FileInfoCache()
+
+def count_file_lines(path):
+    """Count lines with a streaming byte scan (matches len(text.split('\\n')))"""
+    newlines = 0
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            newlines += chunk.count(b'\n')
+    return newlines + 1
+
+def get_file_metadata(filename):
+    """Return size, line count and modification time for a file, or None if missing"""
+    cache = get_file_info_cache().metadata
+    try:
+        stat = Path(filename).stat()
+    except OSError:
+        cache.pop(filename, None)
+        return None
+    
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = cache.get(filename)
+    if cached and cached[0] == signature:
+        return cached[1]
+    
+    info = freeze({
+        'size': stat.st_size,
+        'lines': count_file_lines(filename),
+        'modified': datetime.fromtimestamp(stat.st_mtime)
+    })
+    cache[filename] = (signature, info)
+    return info
+
+def count_markdown_files(directory='.'):
+    """Count *.md files in a directory, re-globbing only when the directory changes"""
+    cache = get_file_info_cache().markdown_counts
+    signature = Path(directory).stat().st_mtime_ns
+    cached = cache.get(directory)
+    if cached and cached[0] == signature:
+        return cached[1]
+    total = len(list(Path(directory).glob('*.md')))
+    cache[directory] = (signature, total)
+    return total
 
+@timed('get_file_update_info')
 def get_file_update_info():
     """Get information about file updates and sizes"""
-    import os
-    from pathlib import Path
-    
     # Get file modification times and sizes
     files_to_check = [
         "MCP_TOOL_TESTING_STATUS.md",
@@ -438,33 +991,478 @@ def get_file_update_info():
     file_info = {}
     
     for filename in files_to_check:
-        path = Path(filename)
-        if path.exists():
-            stat = path.stat()
-            mod_time = datetime.fromtimestamp(stat.st_mtime)
-            file_info[filename] = {
-                'size': stat.st_size,
-                'lines': len(path.read_text().split('\n')),
-                'modified': mod_time
-            }
-            if latest_time is None or mod_time > latest_time:
-                latest_time = mod_time
-    
-    # Count total markdown files
-    total_docs = len(list(Path('.').glob('*.md')))
+        info = get_file_metadata(filename)
+        if info:
+            file_info[filename] = info
+            if latest_time is None or info['modified'] > latest_time:
+                latest_time = info['modified']
     
     return {
         'last_updated': latest_time.strftime("%Y-%m-%d %H:%M") if latest_time else "Unknown",
         'testing_status_size': file_info.get('MCP_TOOL_TESTING_STATUS.md', {}).get('lines', 0),
         'progress_size': file_info.get('TESTING_PROGRESS.md', {}).get('lines', 0),
-        'total_docs': total_docs,
+        'total_docs': count_markdown_files(),
         'file_info': file_info
     }
 
-@st.cache_data
+StatusSnapshot = namedtuple('StatusSnapshot', ['tool_status', 'completed_tools', 'status_lookup', 'fingerprint'])
+
+@timed('load_status_snapshot')
+def load_status_snapshot():
+    """Parse both testing documents into a read-only view with a tool -> status lookup"""
+    tool_status = parse_tool_testing_status()
+    completed_tools = parse_testing_progress()
+    
+    status_lookup = {}
+    for tool in tool_status:
+        status_lookup[tool['name']] = tool
+    for tool in completed_tools:
+        if tool['name'] not in status_lookup:
+            status_lookup[tool['name']] = freeze({
+                'name': tool['name'],
+                'status': tool['status'],
+                'status_category': 'verified',
+                'issues': 'None',
+                'priority': '-'
+            })
+    
+    fingerprint = content_hash(json.dumps([[dict(tool) for tool in tool_status],
+                                           [dict(tool) for tool in completed_tools]],
+                                          sort_keys=True))
+    return StatusSnapshot(tool_status, completed_tools, MappingProxyType(status_lookup), fingerprint)
+
+class StatusStore:
+    """Stale-while-revalidate holder for the status snapshot
+    
+    Readers always get the last good snapshot without waiting. refresh() hands
+    the re-parse to a single background worker; requests arriving while it runs
+    are coalesced into one more pass, and their callbacks fire once the new
+    snapshot is in place.
+    """
+    
+    def __init__(self):
+        self.snapshot = None
+        self.refreshing = False
+        self.pending = False
+        self.callbacks = []
+        self.last_error = None
+        self.lock = threading.Lock()
+    
+    def current(self):
+        snapshot = self.snapshot
+        if snapshot is None:
+            # Only the very first read parses on the request path
+            with self.lock:
+                if self.snapshot is None:
+                    self.snapshot = load_status_snapshot()
+                    record_status_history(self.snapshot)
+                snapshot = self.snapshot
+        return snapshot
+    
+    def reset(self):
+        """Drop the snapshot; the next read parses again"""
+        with self.lock:
+            self.snapshot = None
+    
+    def refresh(self, on_done=None):
+        with self.lock:
+            if on_done is not None:
+                self.callbacks.append(on_done)
+            if self.refreshing:
+                self.pending = True
+                return
+            self.refreshing = True
+        threading.Thread(target=self.revalidate, name="status-refresh", daemon=True).start()
+    
+    def revalidate(self):
+        while True:
+            try:
+                self.snapshot = load_status_snapshot()
+                self.last_error = None
+                record_status_history(self.snapshot)
+            except Exception as e:  # Keep serving the last good snapshot
+                self.last_error = str(e)
+            with self.lock:
+                if not self.pending:
+                    self.refreshing = False
+                    callbacks, self.callbacks = self.callbacks, []
+                    break
+                self.pending = False
+        for callback in callbacks:
+            callback()
+
+# Append-only history of every status change; a snapshot is recorded whenever it
+# differs from the latest one, so reverting to an earlier state is a new point
+# rather than a duplicate. Catalog tools and statuses are dictionary-encoded:
+# each row holds two parallel columns (little-endian uint16 tool ids from
+# history_tools, one STATUS_CODES byte per tool) plus the counts the timeline
+# needs, so charting never decodes the columns.
+STATUS_HISTORY_PATH = Path(os.environ.get('HABU_SHOWCASE_HISTORY_PATH', PARSE_CACHE_DIR / 'status_history.sqlite3'))
+STATUS_HISTORY_MAX_POINTS = int(os.environ.get('HABU_SHOWCASE_HISTORY_MAX_POINTS', '200'))
+STATUS_CODES = ['untested', 'verified', 'partial', 'issue']
+
+StatusHistory = namedtuple('StatusHistory', ['snapshots', 'timeline', 'transitions'])
+
+def open_status_history():
+    """Open (and create if needed) the status history database"""
+    STATUS_HISTORY_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(STATUS_HISTORY_PATH, timeout=5)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('CREATE TABLE IF NOT EXISTS history_tools (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE)')
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS status_history (
+            id INTEGER PRIMARY KEY,
+            fingerprint TEXT NOT NULL,
+            recorded_at REAL NOT NULL,
+            tool_ids BLOB NOT NULL,
+            status_codes BLOB NOT NULL,
+            verified INTEGER NOT NULL,
+            partial INTEGER NOT NULL,
+            issue INTEGER NOT NULL
+        )
+    """)
+    conn.execute('CREATE INDEX IF NOT EXISTS status_history_time ON status_history (recorded_at)')
+    return conn
+
+def snapshot_tool_statuses(snapshot, tools):
+    """Status category of each catalog tool with the dashboard's precedence
+    
+    Completed, then the first status record, otherwise untested; rows for
+    anything outside the catalog (section headings the parser picks up) are
+    left out so the history counts match the dashboard.
+    """
+    records = {}
+    for record in snapshot.tool_status:
+        records.setdefault(record['name'], record.get('status_category') or 'untested')
+    completed = {record['name'] for record in snapshot.completed_tools}
+    return {tool: 'verified' if tool in completed else records.get(tool, 'untested') for tool in tools}
+
+def record_status_history(snapshot):
+    """Append a snapshot unless it matches the most recently recorded one
+    
+    Timestamped with the newest status document mtime, i.e. when the change was
+    made rather than when the showcase noticed it.
+    """
+    statuses = snapshot_tool_statuses(snapshot, [tool for tools in get_tool_categories().values() for tool in tools])
+    try:
+        recorded_at = max((Path(filename).stat().st_mtime for filename in STATUS_DOCUMENTS if Path(filename).exists()),
+                          default=time.time())
+        conn = open_status_history()
+        try:
+            with conn:
+                # Taken before reading so processes don't both append the same change
+                conn.execute('BEGIN IMMEDIATE')
+                latest = conn.execute('SELECT fingerprint FROM status_history ORDER BY id DESC LIMIT 1').fetchone()
+                if latest and latest[0] == snapshot.fingerprint:
+                    return False
+                conn.executemany('INSERT OR IGNORE INTO history_tools (name) VALUES (?)', [(name,) for name in statuses])
+                tool_ids = dict(conn.execute('SELECT name, id FROM history_tools'))
+                names = sorted(statuses, key=tool_ids.get)
+                counts = dict.fromkeys(STATUS_CODES, 0)
+                for status in statuses.values():
+                    counts[status] = counts.get(status, 0) + 1
+                conn.execute(
+                    'INSERT INTO status_history (fingerprint, recorded_at, tool_ids, status_codes, verified, partial, issue) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    (snapshot.fingerprint, recorded_at,
+                     struct.pack(f'<{len(names)}H', *(tool_ids[name] for name in names)),
+                     bytes(STATUS_CODES.index(statuses[name]) if statuses[name] in STATUS_CODES else 0 for name in names),
+                     counts['verified'], counts['partial'], counts['issue'])
+                )
+                return True
+        finally:
+            conn.close()
+    except (sqlite3.Error, OSError, struct.error):
+        # History is best effort and must never break the page
+        return False
+
+def status_history_version():
+    """(snapshot count, newest id) of the history; changes whenever a snapshot is appended"""
+    try:
+        conn = open_status_history()
+        try:
+            return conn.execute('SELECT COUNT(*), MAX(id) FROM status_history').fetchone()
+        finally:
+            conn.close()
+    except (sqlite3.Error, OSError):
+        return (0, None)
+
+@timed('load_status_history')
+def load_status_history(max_points=STATUS_HISTORY_MAX_POINTS):
+    """Downsampled status counts over time and every per-tool status transition
+    
+    The timeline is reduced in SQL to at most max_points time buckets. Counts
+    describe a state, so each bucket keeps its newest snapshot (SQLite returns
+    the bare columns of the MAX() row).
+    """
+    conn = open_status_history()
+    try:
+        snapshots, start, end = conn.execute(
+            'SELECT COUNT(*), MIN(recorded_at), MAX(recorded_at) FROM status_history').fetchone()
+        if not snapshots:
+            return StatusHistory(0, (), ())
+        width = (end - start) / max_points or 1
+        timeline = conn.execute("""
+            SELECT MAX(recorded_at), verified, partial, issue FROM status_history
+            GROUP BY MIN(CAST((recorded_at - ?) / ? AS INTEGER), ?)
+            ORDER BY 1
+        """, (start, width, max_points - 1)).fetchall()
+        
+        names = dict(conn.execute('SELECT id, name FROM history_tools'))
+        transitions, previous = [], None
+        for recorded_at, tool_ids, status_codes in conn.execute(
+                'SELECT recorded_at, tool_ids, status_codes FROM status_history ORDER BY recorded_at, id'):
+            current = dict(zip(struct.unpack(f'<{len(tool_ids) // 2}H', tool_ids), status_codes))
+            if previous is not None:
+                # A tool missing from a snapshot counts as untested
+                for tool_id in sorted(previous.keys() | current.keys()):
+                    before, after = previous.get(tool_id, 0), current.get(tool_id, 0)
+                    if before != after:
+                        transitions.append((recorded_at, names[tool_id], STATUS_CODES[before], STATUS_CODES[after]))
+            previous = current
+        return StatusHistory(snapshots, tuple(timeline), tuple(reversed(transitions)))
+    finally:
+        conn.close()
+
+@metered_cache('get_status_history', max_entries=2)
+def get_status_history(version):
+    """Status history for one history version, shared across sessions"""
+    return load_status_history()
+
+@st.cache_resource
+def get_status_store():
+    """Process-wide status snapshot holder"""
+    return StatusStore()
+
+def get_status_snapshot():
+    """Shared, read-only view of both testing documents; never blocks on a refresh"""
+    return get_status_store().current()
+
+# Documents watched for live updates: the caches each one feeds and the pages
+# that should rerun when it changes. The status documents are refreshed in the
+# background by the StatusStore instead of being cleared.
+STATUS_DOCUMENTS = ["MCP_TOOL_TESTING_STATUS.md", "TESTING_PROGRESS.md"]
+WATCHED_DOC_CACHES = {}
+SHOWCASE_PAGES = [
+    "🏠 Project Overview",
+    "🛠️ MCP Tools Explorer",
+    "📊 Testing Dashboard",
+    "🧠 Key Learnings",
+    "⚠️ Known Limitations",
+    "🎯 Work To Do",
+    "📚 Documentation Hub"
+]
+LIVE_DATA_PAGES = ["🏠 Project Overview", "🛠️ MCP Tools Explorer", "📊 Testing Dashboard"]
+WATCHED_DOC_PAGES = {
+    "MCP_TOOL_TESTING_STATUS.md": LIVE_DATA_PAGES,
+    "TESTING_PROGRESS.md": LIVE_DATA_PAGES,
+    "README.md": ["🏠 Project Overview"],
+    "MISSION_ACCOMPLISHED.md": ["🏠 Project Overview"],
+}
+# watchdog also reports plain reads (opened, closed_no_write); reacting to them
+# would turn every re-parse into the next refresh
+DOC_CHANGE_EVENTS = {'created', 'modified', 'moved', 'deleted', 'closed'}
+DOC_WATCH_POLL_SECONDS = float(os.environ.get('HABU_SHOWCASE_WATCH_POLL_SECONDS', '2'))
+
+class DocWatcher(FileSystemEventHandler):
+    """Watch the showcase documents and invalidate the caches built from them"""
+    
+    def __init__(self, filenames, refreshers=None):
+        self.paths = {Path(filename).resolve(): filename for filename in filenames}
+        self.refreshers = refreshers or {}
+        self.generations = dict.fromkeys(filenames, 0)
+        self.lock = threading.Lock()
+        self.observer = None
+        self.stopped = threading.Event()
+    
+    def signatures(self):
+        def signature(path):
+            try:
+                stat = path.stat()
+                return (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                return None
+        return {path: signature(path) for path in self.paths}
+    
+    def start(self):
+        baseline = self.signatures()
+        if Observer is not None:
+            try:
+                self.observer = Observer()
+                for directory in {path.parent for path in self.paths}:
+                    if directory.is_dir():
+                        self.observer.schedule(self, str(directory), recursive=False)
+                self.observer.daemon = True
+                self.observer.start()
+            except OSError:  # e.g. inotify watch limit reached
+                self.observer = None
+        if self.observer is None:
+            threading.Thread(target=self.poll, args=(baseline,), name="doc-watcher", daemon=True).start()
+        else:
+            # Edits made while the observer was being set up have no event
+            for path, signature in self.signatures().items():
+                if signature != baseline[path]:
+                    self.mark_changed(self.paths[path])
+        return self
+    
+    def stop(self):
+        """Stop watching; called when Streamlit releases the cached watcher"""
+        self.stopped.set()
+        if self.observer is not None:
+            self.observer.stop()
+            self.observer.join(timeout=5)
+    
+    def on_any_event(self, event):
+        if event.event_type not in DOC_CHANGE_EVENTS:
+            return
+        for raw_path in (event.src_path, getattr(event, 'dest_path', '')):
+            filename = self.paths.get(Path(os.fsdecode(raw_path)).resolve()) if raw_path else None
+            if filename:
+                self.mark_changed(filename)
+    
+    def poll(self, seen):
+        while not self.stopped.wait(DOC_WATCH_POLL_SECONDS):
+            for path, current in self.signatures().items():
+                if current != seen[path]:
+                    seen[path] = current
+                    self.mark_changed(self.paths[path])
+    
+    def mark_changed(self, filename):
+        """Invalidate or refresh exactly the caches built from filename and bump its generation"""
+        for cached_function in WATCHED_DOC_CACHES.get(filename, []):
+            cached_function.clear()
+        refresh = self.refreshers.get(filename)
+        if refresh is not None:
+            # Pages rerun once the refreshed data is in place
+            refresh(on_done=lambda: self.bump(filename))
+        else:
+            self.bump(filename)
+    
+    def bump(self, filename):
+        with self.lock:
+            self.generations[filename] += 1
+    
+    def generation_for(self, page):
+        """Return the combined generation of every document behind a page"""
+        with self.lock:
+            return tuple(self.generations[filename] for filename, pages in WATCHED_DOC_PAGES.items()
+                         if page in pages)
+
+@st.cache_resource(on_release=DocWatcher.stop)
+def get_doc_watcher():
+    """Start the process-wide document watcher once; a cache clear stops it and the next run starts a fresh one"""
+    store = get_status_store()
+    return DocWatcher(list(WATCHED_DOC_PAGES), dict.fromkeys(STATUS_DOCUMENTS, store.refresh)).start()
+
+@st.fragment(run_every=DOC_WATCH_POLL_SECONDS)
+def rerun_on_doc_change(page):
+    """Rerun this session when a document behind the current page changes"""
+    generation = (page, get_doc_watcher().generation_for(page))
+    previous = st.session_state.get('doc_generation')
+    st.session_state['doc_generation'] = generation
+    if previous is not None and previous[0] == page and previous != generation:
+        st.rerun()
+
+# The MCP server whose ListTools handler the showcase catalog is derived from
+MCP_SERVER_SOURCE = Path(os.environ.get(
+    'HABU_MCP_SERVER_SOURCE',
+    Path(__file__).resolve().parents[2] / 'mcp-habu-server-bundle' / 'src' / 'index.ts'
+))
+# Strings, comments and punctuation of a JS/TS object literal
+JS_TOKEN = re.compile(r"""'(?:\\.|[^'\\])*'|"(?:\\.|[^"\\])*"|`(?:\\.|[^`\\])*`|//[^\n]*|/\*.*?\*/|[{}\[\],]""", re.S)
+JS_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r'}
+JS_LEADING_TRIVIA = re.compile(r"(?:\s+|//[^\n]*|/\*.*?\*/)*", re.S)
+
+def parse_js_string(value):
+    """Decode (and concatenate) the JS string literals in a property value"""
+    literals = [token.group(0) for token in JS_TOKEN.finditer(value) if token.group(0)[0] in '\'"`']
+    return ''.join(re.sub(r'\\(.)', lambda m: JS_ESCAPES.get(m.group(1), m.group(1)), literal[1:-1], flags=re.S)
+                   for literal in literals)
+
+def split_js_literal(source, start):
+    """Return the (start, end) spans of the top-level entries of the {...} or [...] at source[start]"""
+    depth = 0
+    entries = []
+    entry_start = start + 1
+    for token in JS_TOKEN.finditer(source, start):
+        value = token.group(0)
+        if value in ('{', '['):
+            depth += 1
+        elif value in ('}', ']'):
+            depth -= 1
+            if depth == 0:
+                if source[entry_start:token.start()].strip():
+                    entries.append((entry_start, token.start()))
+                return entries
+        elif value == ',' and depth == 1:
+            entries.append((entry_start, token.start()))
+            entry_start = token.end()
+    raise ValueError(f"Unterminated literal at offset {start}")
+
+def js_object_fields(source, start):
+    """Map each top-level key of the object literal at source[start] to its value span"""
+    fields = {}
+    for entry_start, entry_end in split_js_literal(source, start):
+        # Comments before a key are not part of it
+        entry_start = JS_LEADING_TRIVIA.match(source, entry_start, entry_end).end()
+        key, separator, _ = source[entry_start:entry_end].partition(':')
+        if separator:
+            fields[key.strip().strip('\'"')] = (entry_start + len(key) + 1, entry_end)
+    return fields
+
+def extract_server_tools(source):
+    """Statically extract name, description and input schema from the ListTools handler"""
+    handler = source.index('setRequestHandler(ListToolsRequestSchema')
+    tools_array = source.index('[', source.index('tools:', handler))
+    
+    def value(span):
+        return source[span[0]:span[1]]
+    
+    tools = []
+    for entry_start, entry_end in split_js_literal(source, tools_array):
+        # Skip spreads and references; only inline tool objects are described statically
+        if not source[entry_start:entry_end].lstrip().startswith('{'):
+            continue
+        fields = js_object_fields(source, source.index('{', entry_start))
+        if 'name' not in fields:
+            continue
+        parameters = []
+        schema = js_object_fields(source, source.index('{', fields['inputSchema'][0])) if 'inputSchema' in fields else {}
+        required = parse_js_list(value(schema['required'])) if 'required' in schema else []
+        if 'properties' in schema:
+            properties = js_object_fields(source, source.index('{', schema['properties'][0]))
+            for parameter, span in properties.items():
+                details = js_object_fields(source, source.index('{', span[0]))
+                parameters.append({
+                    'name': parameter,
+                    'type': parse_js_string(value(details['type'])) if 'type' in details else 'any',
+                    'description': parse_js_string(value(details['description'])) if 'description' in details else '',
+                    'required': parameter in required
+                })
+        tools.append({
+            'name': parse_js_string(value(fields['name'])),
+            'description': parse_js_string(value(fields['description'])) if 'description' in fields else '',
+            'parameters': parameters
+        })
+    return tools
+
+def parse_js_list(value):
+    """Decode a JS array of string literals"""
+    return [parse_js_string(token.group(0)) for token in JS_TOKEN.finditer(value) if token.group(0)[0] in '\'"`']
+
+def get_server_tools():
+    """Tools registered by the MCP server, cached on disk by file stat and content hash"""
+    if not MCP_SERVER_SOURCE.exists():
+        return []
+    try:
+        return load_parsed_file(str(MCP_SERVER_SOURCE), "server_tools", extract_server_tools)
+    except ValueError:  # Handler not found or malformed
+        return []
+
+@metered_cache('get_tool_categories')
 def get_tool_categories():
-    """Define tool categories and their tools"""
-    return {
+    """Define tool categories and their tools, reconciled with the deployed MCP server"""
+    categories = {
         "Foundation Tools (9)": [
             "test_connection", "list_cleanrooms", "list_questions", 
             "configure_data_connection_fields", "complete_data_connection_setup",
@@ -501,28 +1499,48 @@ def get_tool_categories():
             "advanced_user_management"
         ]
     }
+    server_tools = [tool['name'] for tool in get_server_tools()]
+    if not server_tools:
+        return freeze(categories)
+    
+    # Keep only tools the server registers and file the rest under their own category
+    reconciled = {}
+    for category, tools in categories.items():
+        tools = [tool for tool in tools if tool in server_tools]
+        if tools:
+            reconciled[f"{category.split(' (')[0]} ({len(tools)})"] = tools
+    categorized = {tool for tools in reconciled.values() for tool in tools}
+    additional = [tool for tool in server_tools if tool not in categorized]
+    if additional:
+        reconciled[f"Additional Server Tools ({len(additional)})"] = additional
+    return freeze(reconciled)
 
 def main():
+    rerun_started = time.perf_counter()
+    apply_page_style()
+    # Documents are watched from the first run on, whether or not any session
+    # auto-refreshes; the checkbox only decides if this session reruns
+    get_doc_watcher()
+    warmer = get_cache_warmer()
+    # Cold runs of tools/benchmark_showcase.py; only server code can set
+    # session state that no widget owns
+    if st.session_state.pop('clear_data_caches', False):
+        clear_data_caches()
+    
     # Header
     st.markdown('<h1 class="main-header">Habu MCP Server Project Overview</h1>', unsafe_allow_html=True)
     st.markdown('<p style="text-align: center; font-size: 1.3rem; color: #666;">Model Context Protocol Server for LiveRamp Clean Room API</p>', unsafe_allow_html=True)
     
     # Sidebar navigation with always-visible menu
     st.sidebar.title("🧭 Navigation")
+    if not warmer.ready.is_set():
+        st.sidebar.caption("⏳ Warming caches in the background...")
     st.sidebar.markdown("---")
     
     # Use radio buttons for always-visible navigation
     page = st.sidebar.radio(
         "Choose a section:",
-        [
-            "🏠 Project Overview", 
-            "🛠️ MCP Tools Explorer", 
-            "📊 Testing Dashboard",
-            "🧠 Key Learnings", 
-            "⚠️ Known Limitations", 
-            "🎯 Work To Do",
-            "📚 Documentation Hub"
-        ],
+        SHOWCASE_PAGES,
         index=0,
         label_visibility="collapsed"
     )
@@ -543,8 +1561,58 @@ def main():
     elif page == "📚 Documentation Hub":
         show_documentation_hub()
     
+    if st.session_state.get('auto_refresh', True) and page in LIVE_DATA_PAGES:
+        rerun_on_doc_change(page)
+    
+    if METRICS_ENABLED:
+        get_metrics().observe('rerun', time.perf_counter() - rerun_started)
+        show_metrics_panel()
+        write_metrics_file()
+    
+
+
+# Overview copy, shared by the app and the static export
+OVERVIEW_INTRO = """
+**The Habu MCP Server** transforms LiveRamp's Clean Room API from raw technical endpoints into intelligent, 
+AI-accessible workflow tools. This is a **Model Context Protocol (MCP) Server** that enables AI agents 
+(Claude, Memex, etc.) to manage enterprise data collaboration workflows.
 
+### 🏗️ Core Architecture
+- **Primary Server**: `mcp-habu-runner/src/index.ts` (45 comprehensive tools)
+- **Authentication**: OAuth2 client credentials flow with production API
+- **Distribution**: Compiled Node.js package ready for any MCP client
+- **Coverage**: 99% of LiveRamp Clean Room API functionality
+"""
+
+KEY_ACHIEVEMENTS = [
+    "✅ **OAuth2 Authentication** - Working with production API after extensive testing",
+    "✅ **Universal Name Resolution** - Users can use cleanroom names instead of cryptic UUIDs",
+    "✅ **Smart Parameter Detection** - Intelligent SQL analysis prevents zero-result queries", 
+    "✅ **End-to-End Validation** - Partner invitation workflow fully tested",
+    "✅ **Enterprise Features** - Bulk operations, templates, advanced exports",
+    "✅ **99% API Coverage** - Comprehensive clean room automation platform"
+]
+
+STATUS_REALITY_CHECK = """
+**Reality Check**: While we have 45 sophisticated workflow tools built with 99% API coverage, 
+only **8 tools** have been validated with real users (18% tested). This represents a solid 
+foundation with enormous potential, but systematic testing is needed to unlock full value.
+"""
 
+def overview_metrics(snapshot):
+    """(value, label) pairs for the success metric cards"""
+    # Calculate actual tested tools dynamically
+    status_names = {ts['name'] for ts in snapshot.tool_status}
+    verified_count = len([t for t in snapshot.tool_status if t.get('status_category') == 'verified'])
+    verified_count += len([t for t in snapshot.completed_tools if t['name'] not in status_names])
+    return [
+        ("99%", "API Coverage"),
+        ("45", "Workflow Tools"),
+        (f"{verified_count}/45", "Tools Tested"),
+        ("✅", "OAuth2 Ready")
+    ]
+
+@timed('show_project_overview')
 def show_project_overview():
     st.header("🏠 Project Overview")
     
@@ -560,116 +1628,285 @@ def show_project_overview():
         st.markdown(f"**Total Docs:** {update_info['total_docs']} files")
     
     # Success metrics
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown("""
-        <div class="success-metric">
-            <h3>99%</h3>
-            <p>API Coverage</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div class="success-metric">
-            <h3>45</h3>
-            <p>Workflow Tools</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        # Calculate actual tested tools dynamically
-        tool_status = parse_tool_testing_status()
-        completed_tools = parse_testing_progress()
-        verified_count = len([t for t in tool_status if t.get('status_category') == 'verified'])
-        verified_count += len([t for t in completed_tools if t['name'] not in [ts['name'] for ts in tool_status]])
-        
-        st.markdown(f"""
-        <div class="success-metric">
-            <h3>{verified_count}/45</h3>
-            <p>Tools Tested</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown("""
-        <div class="success-metric">
-            <h3>✅</h3>
-            <p>OAuth2 Ready</p>
-        </div>
-        """, unsafe_allow_html=True)
+    for col, (value, label) in zip(st.columns(4), overview_metrics(get_status_snapshot())):
+        with col:
+            st.markdown(f"""
+            <div class="success-metric">
+                <h3>{value}</h3>
+                <p>{label}</p>
+            </div>
+            """, unsafe_allow_html=True)
     
     st.markdown("---")
     
     # What is this project
     st.subheader("🎯 What We've Built")
-    st.markdown("""
-    **The Habu MCP Server** transforms LiveRamp's Clean Room API from raw technical endpoints into intelligent, 
-    AI-accessible workflow tools. This is a **Model Context Protocol (MCP) Server** that enables AI agents 
-    (Claude, Memex, etc.) to manage enterprise data collaboration workflows.
-    
-    ### 🏗️ Core Architecture
-    - **Primary Server**: `mcp-habu-runner/src/index.ts` (45 comprehensive tools)
-    - **Authentication**: OAuth2 client credentials flow with production API
-    - **Distribution**: Compiled Node.js package ready for any MCP client
-    - **Coverage**: 99% of LiveRamp Clean Room API functionality
-    """)
+    st.markdown(OVERVIEW_INTRO)
     
     # Major achievements
     st.subheader("🏆 Key Achievements")
-    achievements = [
-        "✅ **OAuth2 Authentication** - Working with production API after extensive testing",
-        "✅ **Universal Name Resolution** - Users can use cleanroom names instead of cryptic UUIDs",
-        "✅ **Smart Parameter Detection** - Intelligent SQL analysis prevents zero-result queries", 
-        "✅ **End-to-End Validation** - Partner invitation workflow fully tested",
-        "✅ **Enterprise Features** - Bulk operations, templates, advanced exports",
-        "✅ **99% API Coverage** - Comprehensive clean room automation platform"
-    ]
-    
-    for achievement in achievements:
+    for achievement in KEY_ACHIEVEMENTS:
         st.markdown(achievement)
     
     # Current status reality check
     st.subheader("📊 Current Status: Built but Minimally Tested")
-    st.info("""
-    **Reality Check**: While we have 45 sophisticated workflow tools built with 99% API coverage, 
-    only **8 tools** have been validated with real users (18% tested). This represents a solid 
-    foundation with enormous potential, but systematic testing is needed to unlock full value.
-    """)
+    st.info(STATUS_REALITY_CHECK)
 
+ExplorerView = namedtuple('ExplorerView', ['result_bits', 'total', 'ordered_tools', 'category_counts', 'labels'])
+
+@timed('build_explorer_view')
+def build_explorer_view(search_term, status, category, feature, api, provider, snapshot):
+    """Evaluate one explorer filter combination
+    
+    Returns the matching (category, tool) pairs in display order, per-category
+    match counts and, for every facet option, its label with the number of
+    tools that option would leave.
+    """
+    facet_index = get_tool_facet_index()
+    facet_bits = dict(facet_index.facets, status=facet_index.status_bits(snapshot))
+    search_scores = get_tool_search_index().search(search_term) if search_term else None
+    status = STATUS_FILTERS.get(status)
+    facet_masks = {
+        'search': facet_index.bits_for(search_scores) if search_scores is not None else None,
+        'status': facet_bits['status'][status] if status else None,
+        'category': facet_bits['category'].get(category, 0) if category != 'All' else None,
+        'feature': facet_bits['feature'][feature] if feature != 'All' else None,
+        'api': facet_index.any_of('api', api),
+        'provider': facet_index.any_of('provider', provider)
+    }
+    
+    # Format each filter option with the number of tools it would leave
+    facet_options = {
+        'status': (["All"] + list(STATUS_FILTERS), lambda o: facet_bits['status'][STATUS_FILTERS[o]]),
+        'category': (["All"] + list(get_tool_categories()), lambda o: facet_bits['category'].get(o, 0)),
+        'feature': (["All"] + list(FEATURE_FILTER_KEYWORDS), lambda o: facet_bits['feature'][o]),
+        'api': (API_FEATURE_FILTERS, lambda o: facet_bits['api'][o]),
+        'provider': (CLOUD_PROVIDER_FILTERS, lambda o: facet_bits['provider'][o])
+    }
+    labels = {}
+    for facet, (options, option_bits) in facet_options.items():
+        other_bits = facet_index.combine(facet_masks, skip=facet)
+        labels[facet] = {option: f"{option} [{count_bits(other_bits if option == 'All' else other_bits & option_bits(option))}]"
+                         for option in options}
+    
+    # One bitwise AND over all facets drives both the summary and the tool list
+    result_bits = facet_index.combine(facet_masks)
+    filtered_categories = {}
+    for position, (tool_category, tool) in enumerate(facet_index.entries):
+        if result_bits >> position & 1:
+            filtered_categories.setdefault(tool_category, []).append(tool)
+    
+    ordered_tools = []
+    for tool_category, filtered_tools in filtered_categories.items():
+        # Best search matches first
+        if search_scores:
+            filtered_tools.sort(key=lambda tool: -search_scores[tool])
+        ordered_tools.extend((tool_category, tool) for tool in filtered_tools)
+    
+    return ExplorerView(
+        result_bits,
+        len(facet_index.entries),
+        tuple(ordered_tools),
+        MappingProxyType({tool_category: len(tools) for tool_category, tools in filtered_categories.items()}),
+        freeze(labels)
+    )
+
+RENDER_CACHE_MAX_ENTRIES = int(os.environ.get('HABU_SHOWCASE_RENDER_CACHE_MAX_ENTRIES', '256'))
+RENDER_CACHE_MAX_BYTES = int(os.environ.get('HABU_SHOWCASE_RENDER_CACHE_MAX_BYTES', str(8 * 1024 * 1024)))
+
+def approximate_size(value, seen=None):
+    """Rough deep size in bytes of cached data, counting each object once
+    
+    Follows containers and the attributes of plain objects; DataFrames report
+    their own deep memory usage and Plotly figures are sized by their data and
+    layout.
+    """
+    if seen is None:
+        seen = set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    
+    if type(value).__module__.startswith('pandas') and hasattr(value, 'memory_usage'):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum() if hasattr(usage, 'sum') else usage)
+    if hasattr(value, 'to_plotly_json'):
+        return sys.getsizeof(value) + approximate_size(value.to_plotly_json(), seen)
+    
+    size = sys.getsizeof(value)
+    if isinstance(value, (dict, MappingProxyType)):
+        size += sum(approximate_size(key, seen) + approximate_size(item, seen) for key, item in value.items())
+    elif isinstance(value, (tuple, list, set, frozenset)):
+        size += sum(approximate_size(item, seen) for item in value)
+    elif not isinstance(value, (str, bytes, type, ModuleType, FunctionType)):
+        if hasattr(value, '__dict__'):
+            size += approximate_size(vars(value), seen)
+        size += sum(approximate_size(getattr(value, slot), seen) for slot in getattr(type(value), '__slots__', ())
+                    if hasattr(value, slot))
+    return size
+
+class RenderCache:
+    """Thread-safe LRU of rendered output shared across sessions, capped by entries and bytes"""
+    
+    def __init__(self, max_entries=RENDER_CACHE_MAX_ENTRIES, max_bytes=RENDER_CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = self.misses = self.evictions = 0
+        self.lock = threading.Lock()
+    
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+    
+    def put(self, key, value):
+        """Store value as most recently used, evicting the oldest entries over the caps; returns value"""
+        size = approximate_size(key) + approximate_size(value)
+        with self.lock:
+            if key in self.entries:
+                self.bytes -= self.entries.pop(key)[1]
+            if size <= self.max_bytes:
+                self.entries[key] = (value, size)
+                self.bytes += size
+            while len(self.entries) > self.max_entries or self.bytes > self.max_bytes:
+                _, (_, evicted_size) = self.entries.popitem(last=False)
+                self.bytes -= evicted_size
+                self.evictions += 1
+        return value
+    
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.bytes = 0
+
+@st.cache_resource
+def get_explorer_view_cache():
+    """Explorer views by (filters, data fingerprint), shared by every session"""
+    return RenderCache()
+
+def clear_data_caches():
+    """Empty the in-memory data caches as a restart would
+    
+    The on-disk parse cache and catalog artifact stay, and so do the process
+    singletons: st.cache_resource.clear() would also release the watcher and
+    warmer, and the next run would start their threads again.
+    """
+    for cached in DATA_CACHES:
+        cached.clear()
+    get_explorer_view_cache().clear()
+    get_status_store().reset()
+
+@timed('get_explorer_view')
+def get_explorer_view(selection, snapshot, catalog):
+    """ExplorerView for a filter selection, from the shared view cache when possible"""
+    view_key = selection + (snapshot.fingerprint, catalog.source_hash)
+    view_cache = get_explorer_view_cache()
+    view = view_cache.get(view_key)
+    if view is None:
+        view = view_cache.put(view_key, build_explorer_view(*selection, snapshot))
+    return view
+
+# (search, status, category, feature, API features, cloud providers) with no filters applied
+DEFAULT_EXPLORER_SELECTION = ('', 'All', 'All', 'All', (), ())
+
+EXPLORER_PAGE_SIZE = int(os.environ.get('HABU_SHOWCASE_EXPLORER_PAGE_SIZE', '12'))
+
+@timed('show_tools_explorer')
 def show_tools_explorer():
     st.header("🛠️ MCP Tools Explorer")
-    st.markdown("Explore all 45 workflow tools organized by category")
+    st.markdown(f"Explore all {sum(len(tools) for tools in get_tool_categories().values())} workflow tools organized by category")
     
     # Auto-refresh toggle
     col1, col2 = st.columns([3, 1])
     with col1:
         st.markdown("**Live updates from testing files**")
     with col2:
-        auto_refresh = st.checkbox("Auto-refresh", value=True)
+        auto_refresh = st.checkbox("Auto-refresh", value=st.session_state.get('auto_refresh', True),
+                                   key="auto_refresh_toggle")
+        st.session_state['auto_refresh'] = auto_refresh
     
     if auto_refresh:
         st.markdown("🔄 _Data refreshes automatically as testing files are updated_")
     
     # Get tool categories and testing status
     categories = get_tool_categories()
-    tool_status = parse_tool_testing_status()
-    completed_tools = parse_testing_progress()
+    catalog = get_tool_catalog()
+    snapshot = get_status_snapshot()
+    status_lookup = snapshot.status_lookup
     
-    # Create status lookup
-    status_lookup = {}
-    for tool in tool_status:
-        status_lookup[tool['name']] = tool
-    for tool in completed_tools:
-        if tool['name'] not in status_lookup:
-            status_lookup[tool['name']] = {
-                'name': tool['name'],
-                'status': tool['status'],
-                'status_category': 'verified',
-                'issues': 'None',
-                'priority': '-'
-            }
+    # Quick Statistics Dashboard
+    col1, col2, col3, col4 = st.columns(4)
+    
+    # Calculate comprehensive tool stats
+    comprehensive_tools = [name for name, record in catalog.records.items() if record.detailed]
+    wizard_tools = [tool for cat_tools in categories.values() for tool in cat_tools if 'wizard' in tool.lower()]
+    verified_tools = [tool for tool in status_lookup.keys() if status_lookup[tool].get('status_category') == 'verified']
+    cloud_tools = [tool for cat_tools in categories.values() for tool in cat_tools 
+                   if any(provider in tool.lower() for provider in ['aws', 'azure', 'gcp', 'snowflake', 'databricks'])]
+    
+    with col1:
+        st.markdown(f"""
+        <div class="stat-card">
+            <h3>{len(comprehensive_tools)}</h3>
+            <p>⭐ Detailed Tools</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(f"""
+        <div class="stat-card">
+            <h3>{len(wizard_tools)}</h3>
+            <p>🧙‍♂️ Interactive Wizards</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown(f"""
+        <div class="stat-card">
+            <h3>{len(verified_tools)}</h3>
+            <p>✅ Verified Tools</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col4:
+        st.markdown(f"""
+        <div class="stat-card">
+            <h3>{len(cloud_tools)}</h3>
+            <p>☁️ Cloud Connections</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    show_explorer_results()
+
+@st.fragment
+@timed('show_explorer_results')
+def show_explorer_results():
+    """Filters, result summary and card grid; a filter change reruns only this region"""
+    categories = get_tool_categories()
+    catalog = get_tool_catalog()
+    snapshot = get_status_snapshot()
+    
+    # Repeat filter combinations are served from the shared view cache without
+    # re-evaluating facets or counts
+    selection = (
+        st.session_state.get('explorer_search', ''),
+        st.session_state.get('explorer_status', 'All'),
+        st.session_state.get('explorer_category', 'All'),
+        st.session_state.get('explorer_feature', 'All'),
+        tuple(sorted(st.session_state.get('explorer_api', []))),
+        tuple(sorted(st.session_state.get('explorer_provider', [])))
+    )
+    view = get_explorer_view(selection, snapshot, catalog)
+    labels = view.labels
     
     # Enhanced Filter and search options
     st.subheader("🔍 Advanced Search & Filtering")
@@ -678,31 +1915,31 @@ def show_tools_explorer():
     col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
     
     with col1:
-        search_term = st.text_input("🔍 Search tools, descriptions, features:", 
-                                  placeholder="e.g. connection, partner, OAuth2, AWS, wizard")
+        st.text_input("🔍 Search tools, descriptions, features:", key="explorer_search",
+                      placeholder="e.g. connection, partner, OAuth2, AWS, wizard")
     with col2:
-        status_filter = st.selectbox("📊 Status:", 
-            ["All", "✅ Verified", "🟡 Partial", "❌ Issues", "⚪ Untested"])
+        st.selectbox("📊 Status:", ["All"] + list(STATUS_FILTERS), key="explorer_status",
+                     format_func=labels['status'].__getitem__)
     with col3:
-        category_filter = st.selectbox("📁 Category:", 
-            ["All"] + list(categories.keys()))
+        st.selectbox("📁 Category:", ["All"] + list(categories.keys()), key="explorer_category",
+                     format_func=labels['category'].__getitem__)
     with col4:
-        feature_filter = st.selectbox("⚡ Feature:", 
-            ["All", "Wizards", "Authentication", "Cloud", "Monitoring", "Export"])
+        st.selectbox("⚡ Feature:", ["All"] + list(FEATURE_FILTER_KEYWORDS), key="explorer_feature",
+                     format_func=labels['feature'].__getitem__)
     
     # Advanced filters (collapsible)
     with st.expander("🔧 Advanced Filters", expanded=False):
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            api_filter = st.multiselect("🔌 API Features:", 
-                ["OAuth2", "Real-time", "Bulk Operations", "Webhooks", "Scheduled"])
+            st.multiselect("🔌 API Features:", API_FEATURE_FILTERS, key="explorer_api",
+                           format_func=labels['api'].__getitem__)
         with col2:
             complexity_filter = st.selectbox("📊 Complexity Level:", 
                 ["All", "Basic", "Intermediate", "Advanced", "Expert"])
         with col3:
-            provider_filter = st.multiselect("☁️ Cloud Providers:", 
-                ["AWS", "Google Cloud", "Azure", "Snowflake", "Databricks"])
+            st.multiselect("☁️ Cloud Providers:", CLOUD_PROVIDER_FILTERS, key="explorer_provider",
+                           format_func=labels['provider'].__getitem__)
     
     # Quick action buttons
     st.markdown("**Quick Filters:**")
@@ -712,91 +1949,18 @@ def show_tools_explorer():
         "🧙‍♂️ Wizards": "wizard",
         "🔐 Auth": "authentication", 
         "☁️ Cloud": "cloud",
-        "📊 Analytics": "question",
-        "👥 Partners": "partner"
-    }
-    
-    active_quick_filter = None
-    for i, (label, keyword) in enumerate(quick_filters.items()):
-        col = [col1, col2, col3, col4, col5][i]
-        with col:
-            if st.button(label, key=f"quick_{keyword}"):
-                active_quick_filter = keyword
-    
-    # Apply quick filter to search term
-    if active_quick_filter:
-        search_term = active_quick_filter
-    
-    # Apply filters
-    filtered_categories = categories.copy()
-    if category_filter != "All":
-        filtered_categories = {category_filter: categories[category_filter]}
-    
-    # Helper function for advanced filtering
-    def passes_advanced_filters(tool_name, tool_info):
-        # Feature filter
-        if feature_filter != "All":
-            feature_keywords = {
-                "Wizards": ["wizard", "interactive", "step-by-step"],
-                "Authentication": ["auth", "oauth", "credentials", "token"],
-                "Cloud": ["aws", "azure", "gcp", "snowflake", "databricks", "cloud"],
-                "Monitoring": ["monitor", "health", "status", "track", "audit"],
-                "Export": ["export", "results", "download", "delivery"]
-            }
-            keywords = feature_keywords.get(feature_filter, [])
-            if not any(keyword.lower() in tool_name.lower() or 
-                      keyword.lower() in tool_info.get('description', '').lower() or
-                      any(keyword.lower() in feature.lower() for feature in tool_info.get('key_features', []))
-                      for keyword in keywords):
-                return False
-        
-        # API filter
-        if api_filter:
-            tool_text = f"{tool_name} {tool_info.get('description', '')} {' '.join(tool_info.get('key_features', []))}"
-            if not any(api_feature.lower() in tool_text.lower() for api_feature in api_filter):
-                return False
-        
-        # Provider filter
-        if provider_filter:
-            tool_text = f"{tool_name} {tool_info.get('description', '')} {' '.join(tool_info.get('key_features', []))}"
-            if not any(provider.lower() in tool_text.lower() for provider in provider_filter):
-                return False
-        
-        return True
+        "📊 Analytics": "question",
+        "👥 Partners": "partner"
+    }
     
-    # Calculate and display filter results summary
-    total_tools = sum(len(tools) for tools in categories.values())
+    for i, (label, keyword) in enumerate(quick_filters.items()):
+        col = [col1, col2, col3, col4, col5][i]
+        with col:
+            st.button(label, key=f"quick_{keyword}", on_click=apply_quick_filter, args=(keyword,))
     
-    # Count filtered tools
-    filtered_count = 0
-    for category, tools in filtered_categories.items():
-        for tool in tools:
-            status_info = status_lookup.get(tool, {
-                'status': 'Not Tested',
-                'status_category': 'untested',
-                'issues': 'No testing data',
-                'priority': '-'
-            })
-            tool_info = get_comprehensive_tool_info().get(tool, get_default_tool_info(tool))
-            
-            # Apply all filters (same logic as above)
-            if status_filter != "All":
-                status_map = {
-                    "✅ Verified": "verified", "🟡 Partial": "partial", 
-                    "❌ Issues": "issue", "⚪ Untested": "untested"
-                }
-                if status_info.get('status_category') != status_map.get(status_filter):
-                    continue
-            
-            if search_term:
-                search_text = f"{tool} {tool_info.get('description', '')} {' '.join(tool_info.get('key_features', []))}"
-                if search_term.lower() not in search_text.lower():
-                    continue
-            
-            if not passes_advanced_filters(tool, tool_info):
-                continue
-                
-            filtered_count += 1
+    result_bits = view.result_bits
+    total_tools = view.total
+    filtered_count = len(view.ordered_tools)
     
     # Display filter summary
     if filtered_count != total_tools:
@@ -806,209 +1970,129 @@ def show_tools_explorer():
     
     st.markdown("---")
     
-    # Quick Statistics Dashboard
-    col1, col2, col3, col4 = st.columns(4)
-    
-    # Calculate comprehensive tool stats
-    comprehensive_tools = list(get_comprehensive_tool_info().keys())
-    wizard_tools = [tool for cat_tools in categories.values() for tool in cat_tools if 'wizard' in tool.lower()]
-    verified_tools = [tool for tool in status_lookup.keys() if status_lookup[tool].get('status_category') == 'verified']
-    cloud_tools = [tool for cat_tools in categories.values() for tool in cat_tools 
-                   if any(provider in tool.lower() for provider in ['aws', 'azure', 'gcp', 'snowflake', 'databricks'])]
+    # Display tools by category, one page at a time: only the visible slice is
+    # looked up and rendered, so render cost stays flat as the catalog grows
+    ordered_tools = view.ordered_tools
+    page_count = max(1, -(-len(ordered_tools) // EXPLORER_PAGE_SIZE))
+    results_signature = (result_bits, selection[0])
+    if st.session_state.get('explorer_page_results') != results_signature or st.session_state.get('explorer_page', 1) > page_count:
+        # New filter results start again from the first page
+        st.session_state['explorer_page_results'] = results_signature
+        st.session_state['explorer_page'] = 1
     
+    col1, col2 = st.columns([3, 1])
+    with col2:
+        page = 1
+        if page_count > 1:
+            page = st.number_input(f"Page (of {page_count})", min_value=1, max_value=page_count, key="explorer_page")
+    first = (page - 1) * EXPLORER_PAGE_SIZE
+    visible_tools = ordered_tools[first:first + EXPLORER_PAGE_SIZE]
     with col1:
-        st.markdown(f"""
-        <div class="stat-card">
-            <h3>{len(comprehensive_tools)}</h3>
-            <p>⭐ Detailed Tools</p>
-        </div>
-        """, unsafe_allow_html=True)
+        if visible_tools:
+            st.caption(f"Showing tools {first + 1}–{first + len(visible_tools)} of {len(ordered_tools)}")
     
-    with col2:
-        st.markdown(f"""
-        <div class="stat-card">
-            <h3>{len(wizard_tools)}</h3>
-            <p>🧙‍♂️ Interactive Wizards</p>
-        </div>
-        """, unsafe_allow_html=True)
+    page_categories = {}
+    for category, tool in visible_tools:
+        page_categories.setdefault(category, []).append(tool)
     
-    with col3:
-        st.markdown(f"""
-        <div class="stat-card">
-            <h3>{len(verified_tools)}</h3>
-            <p>✅ Verified Tools</p>
+    # One action bar serves every card on the page instead of a button per card;
+    # details open in a dialog that reruns on its own
+    if visible_tools:
+        col1, col2 = st.columns([2, 3])
+        with col1:
+            action_tool = st.selectbox("🎯 Open a tool on this page:", [tool for _, tool in visible_tools],
+                                       key="explorer_action_tool")
+        panels = get_tool_panels(action_tool, snapshot.fingerprint, catalog.source_hash,
+                                 _snapshot=snapshot, _catalog=catalog)
+        with col2:
+            for column, (panel, label) in zip(st.columns(len(TOOL_PANELS)), TOOL_PANELS.items()):
+                with column:
+                    if st.button(label, key=f"open_{panel}", disabled=panel not in panels,
+                                 use_container_width=True):
+                        show_tool_dialog(action_tool, panel)
+    
+    # Each category's cards go out as one precomputed HTML element
+    for category, page_tools in page_categories.items():
+        with st.expander(f"📁 {category} ({view.category_counts[category]} tools)", expanded=True):
+            st.markdown(get_category_cards_html(tuple(page_tools), snapshot.fingerprint, catalog.source_hash,
+                                                _snapshot=snapshot, _catalog=catalog),
+                        unsafe_allow_html=True)
+    
+    # Cards are already on their way; warm the detail panels for the tools in view
+    for _, tool in visible_tools:
+        get_tool_panels(tool, snapshot.fingerprint, catalog.source_hash, _snapshot=snapshot, _catalog=catalog)
+
+STATUS_STYLES = {
+    'verified': ("✅", "status-verified"),
+    'partial': ("🟡", "status-partial"),
+    'issue': ("❌", "status-issue"),
+    'untested': ("⚪", "status-untested")
+}
+
+def tool_card_html(tool, status_info, tool_info):
+    """Explorer card markup for one tool; used by the app and the static export"""
+    # Status icon and color
+    icon, css_class = STATUS_STYLES.get(status_info.get('status_category', 'untested'), STATUS_STYLES['untested'])
+    
+    # Description preview, features, API endpoints and badges are precompiled
+    # into the catalog record
+    parts = [f"""
+    <div class="tool-card">
+        <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 0.5rem;">
+            <h4 style="margin: 0; flex: 1;">{icon} <span class="{css_class}">{tool}</span></h4>
+            <div style="display: flex; gap: 4px; flex-wrap: wrap;">
+                {tool_info.badges_html}
+            </div>
         </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown(f"""
-        <div class="stat-card">
-            <h3>{len(cloud_tools)}</h3>
-            <p>☁️ Cloud Connections</p>
+        <div style="margin-bottom: 0.8rem; font-size: 0.9rem; color: #555; line-height: 1.4;">
+            {tool_info.description_preview}
         </div>
-        """, unsafe_allow_html=True)
+    """]
     
-    st.markdown("---")
+    if tool_info.key_features_text:
+        parts.append(f"""
+        <div style='margin-bottom: 0.8rem; font-size: 0.85rem; color: #666; border-left: 3px solid #007bff; padding-left: 8px;'>
+            <strong>⚡ Key Features:</strong><br>{tool_info.key_features_text}
+        </div>
+        """)
     
-    # Display tools by category
-    for category, tools in filtered_categories.items():
-        # Filter tools based on all criteria
-        filtered_tools = []
-        for tool in tools:
-            status_info = status_lookup.get(tool, {
-                'status': 'Not Tested',
-                'status_category': 'untested',
-                'issues': 'No testing data',
-                'priority': '-'
-            })
-            
-            # Get comprehensive tool info for filtering
-            tool_info = get_comprehensive_tool_info().get(tool, get_default_tool_info(tool))
-            
-            # Apply status filter
-            if status_filter != "All":
-                status_map = {
-                    "✅ Verified": "verified",
-                    "🟡 Partial": "partial", 
-                    "❌ Issues": "issue",
-                    "⚪ Untested": "untested"
-                }
-                if status_info.get('status_category') != status_map.get(status_filter):
-                    continue
-            
-            # Apply search filter (search in name, description, and features)
-            if search_term:
-                search_text = f"{tool} {tool_info.get('description', '')} {' '.join(tool_info.get('key_features', []))}"
-                if search_term.lower() not in search_text.lower():
-                    continue
-            
-            # Apply advanced filters
-            if not passes_advanced_filters(tool, tool_info):
-                continue
-                
-            filtered_tools.append((tool, status_info, tool_info))
-        
-        if filtered_tools:  # Only show category if it has matching tools
-            with st.expander(f"📁 {category} ({len(filtered_tools)} tools)", expanded=True):
-                for tool, status_info, tool_info in filtered_tools:
-                    # Status icon and color
-                    status_cat = status_info.get('status_category', 'untested')
-                    if status_cat == 'verified':
-                        icon = "✅"
-                        css_class = "status-verified"
-                    elif status_cat == 'partial':
-                        icon = "🟡"
-                        css_class = "status-partial"
-                    elif status_cat == 'issue':
-                        icon = "❌"
-                        css_class = "status-issue"
-                    else:
-                        icon = "⚪"
-                        css_class = "status-untested"
-                    
-                    # Create enhanced tool card layout with comprehensive information
-                    with st.container():
-                        # Main tool info with description - ensure no HTML content
-                        raw_description = tool_info.get('description', f'Advanced workflow tool for {tool.replace("_", " ").title()}')
-                        # Clean any potential HTML content from descriptions
-                        description_preview = clean_text_content(raw_description)
-                        if len(description_preview) > 150:
-                            description_preview = description_preview[:150] + "..."
-                        
-                        # Format key features properly (show first 3 features)
-                        key_features_text = ""
-                        if tool_info.get('key_features'):
-                            features = tool_info['key_features'][:3]
-                            # Clean each feature to prevent HTML issues
-                            cleaned_features = [clean_text_content(feature) for feature in features]
-                            key_features_text = ' • '.join(cleaned_features)
-                        
-                        # Determine tool type badges
-                        tool_badges = []
-                        tool_name_lower = tool.lower()
-                        if 'wizard' in tool_name_lower:
-                            tool_badges.append('<span style="background: #17a2b8; color: white; padding: 2px 6px; border-radius: 10px; font-size: 0.7rem;">🧙‍♂️ WIZARD</span>')
-                        if any(provider in tool_name_lower for provider in ['aws', 'azure', 'gcp', 'snowflake', 'databricks']):
-                            tool_badges.append('<span style="background: #28a745; color: white; padding: 2px 6px; border-radius: 10px; font-size: 0.7rem;">☁️ CLOUD</span>')
-                        if 'connection' in tool_name_lower:
-                            tool_badges.append('<span style="background: #fd7e14; color: white; padding: 2px 6px; border-radius: 10px; font-size: 0.7rem;">🔗 CONNECTION</span>')
-                        if any(word in tool_name_lower for word in ['monitor', 'health', 'audit']):
-                            tool_badges.append('<span style="background: #6f42c1; color: white; padding: 2px 6px; border-radius: 10px; font-size: 0.7rem;">📊 MONITORING</span>')
-                        
-                        badges_html = ' '.join(tool_badges) if tool_badges else ''
-                        
-                        # Check if this tool has comprehensive information
-                        has_comprehensive_info = tool in get_comprehensive_tool_info()
-                        comprehensive_badge = '<span style="background: #dc3545; color: white; padding: 2px 6px; border-radius: 10px; font-size: 0.7rem;">⭐ DETAILED</span>' if has_comprehensive_info else ''
-                        
-                        st.markdown(f"""
-                        <div class="tool-card">
-                            <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 0.5rem;">
-                                <h4 style="margin: 0; flex: 1;">{icon} <span class="{css_class}">{tool}</span></h4>
-                                <div style="display: flex; gap: 4px; flex-wrap: wrap;">
-                                    {comprehensive_badge}
-                                    {badges_html}
-                                </div>
-                            </div>
-                            <div style="margin-bottom: 0.8rem; font-size: 0.9rem; color: #555; line-height: 1.4;">
-                                {description_preview}
-                            </div>
-                        """, unsafe_allow_html=True)
-                        
-                        if key_features_text:
-                            st.markdown(f"""
-                            <div style='margin-bottom: 0.8rem; font-size: 0.85rem; color: #666; border-left: 3px solid #007bff; padding-left: 8px;'>
-                                <strong>⚡ Key Features:</strong><br>{key_features_text}
-                            </div>
-                            """, unsafe_allow_html=True)
-                        
-                        # API calls preview (if available)
-                        if tool_info.get('primary_api_calls'):
-                            api_preview = tool_info['primary_api_calls'][:2]  # Show first 2 API calls
-                            # Clean API calls and get just the endpoint part
-                            cleaned_apis = [clean_text_content(api.split(' - ')[0]) for api in api_preview]
-                            api_text = ' • '.join(cleaned_apis)
-                            st.markdown(f"""
-                            <div style='margin-bottom: 0.8rem; font-size: 0.82rem; color: #495057; background: #f8f9fa; padding: 6px 8px; border-radius: 4px;'>
-                                <strong>🔌 API Endpoints:</strong> {api_text}
-                            </div>
-                            """, unsafe_allow_html=True)
-                        
-                        # Status and metadata row
-                        issues_text = status_info.get('issues', 'None')
-                        if len(issues_text) > 30:
-                            issues_text = issues_text[:30] + "..."
-                        
-                        st.markdown(f"""
-                            <div style="display: grid; grid-template-columns: 1fr 1fr 1fr; gap: 0.8rem; margin-top: 0.8rem; font-size: 0.83rem; background: #f8f9fa; padding: 8px; border-radius: 6px;">
-                                <div><strong>Status:</strong><br><span class="{css_class}">{status_info['status']}</span></div>
-                                <div><strong>Issues:</strong><br>{issues_text}</div>
-                                <div><strong>Priority:</strong><br>{status_info.get('priority', 'Not set')}</div>
-                            </div>
-                        </div>
-                        """, unsafe_allow_html=True)
-                        
-                        # Action buttons
-                        col1, col2, col3, col4 = st.columns([1, 1, 1, 1])
-                        with col1:
-                            if st.button(f"📖 Details", key=f"details_{tool}", use_container_width=True):
-                                show_tool_details(tool, status_info)
-                        with col2:
-                            if has_comprehensive_info:
-                                if st.button(f"⚡ Quick Info", key=f"quick_{tool}", use_container_width=True):
-                                    show_quick_tool_info(tool, tool_info)
-                        with col3:
-                            if tool_info.get('primary_api_calls'):
-                                if st.button(f"🔌 API", key=f"api_{tool}", use_container_width=True):
-                                    show_api_info(tool, tool_info)
-                        with col4:
-                            if 'wizard' in tool.lower():
-                                st.markdown('<span style="color: #17a2b8; font-size: 0.8rem;">🧙‍♂️ Interactive</span>', unsafe_allow_html=True)
-
-@st.cache_data
+    # API calls preview (if available)
+    if tool_info.api_text:
+        parts.append(f"""
+        <div style='margin-bottom: 0.8rem; font-size: 0.82rem; color: #495057; background: #f8f9fa; padding: 6px 8px; border-radius: 4px;'>
+            <strong>🔌 API Endpoints:</strong> {tool_info.api_text}
+        </div>
+        """)
+    
+    # Status and metadata row
+    issues_text = status_info.get('issues', 'None')
+    if len(issues_text) > 30:
+        issues_text = issues_text[:30] + "..."
+    
+    parts.append(f"""
+        <div style="display: grid; grid-template-columns: 1fr 1fr 1fr; gap: 0.8rem; margin-top: 0.8rem; font-size: 0.83rem; background: #f8f9fa; padding: 8px; border-radius: 6px;">
+            <div><strong>Status:</strong><br><span class="{css_class}">{status_info['status']}</span></div>
+            <div><strong>Issues:</strong><br>{issues_text}</div>
+            <div><strong>Priority:</strong><br>{status_info.get('priority', 'Not set')}</div>
+        </div>
+    </div>
+    """)
+    return "".join(parts)
+
+@metered_cache('get_category_cards_html', max_entries=256)
+def get_category_cards_html(tools, status_fingerprint, catalog_hash, *, _snapshot, _catalog):
+    """Card markup for one category's visible tools, keyed by the tools shown and the data versions
+    
+    Built from the snapshot and catalog those versions were read from.
+    """
+    status_lookup = _snapshot.status_lookup
+    return "".join(tool_card_html(tool, status_lookup.get(tool, UNTESTED_STATUS), _catalog.lookup(tool))
+                   for tool in tools)
+
+@metered_cache('get_comprehensive_tool_info')
 def get_comprehensive_tool_info():
     """Get comprehensive tool information including technical details"""
-    return {
+    return freeze({
         'test_connection': {
             'description': 'Test OAuth2 authentication and API connectivity with the Habu Clean Room API. Returns detailed connection status and available resources.',
             'primary_api_calls': [
@@ -1883,7 +2967,7 @@ def get_comprehensive_tool_info():
                 'Manage connection lifecycle'
             ]
         }
-    }
+    })
 
 def get_default_tool_info(tool_name):
     """Get default tool information for tools not in the comprehensive database"""
@@ -1897,221 +2981,621 @@ def get_default_tool_info(tool_name):
         ]
     }
 
-def show_quick_tool_info(tool_name, tool_info):
-    """Show quick overview of tool information in a compact format"""
-    st.markdown(f"### ⚡ Quick Info: {tool_name}")
+# Compiled tool catalog: get_comprehensive_tool_info() stays the source of truth and
+# is compiled into compact records with card fragments precomputed
+CATALOG_FORMAT_VERSION = 2
+CATALOG_ARTIFACT_PATH = Path(os.environ.get('HABU_SHOWCASE_CATALOG', PARSE_CACHE_DIR / 'tool_catalog.json'))
+TOOL_BADGES = {
+    'detailed': '<span style="background: #dc3545; color: white; padding: 2px 6px; border-radius: 10px; font-size: 0.7rem;">⭐ DETAILED</span>',
+    'wizard': '<span style="background: #17a2b8; color: white; padding: 2px 6px; border-radius: 10px; font-size: 0.7rem;">🧙‍♂️ WIZARD</span>',
+    'cloud': '<span style="background: #28a745; color: white; padding: 2px 6px; border-radius: 10px; font-size: 0.7rem;">☁️ CLOUD</span>',
+    'connection': '<span style="background: #fd7e14; color: white; padding: 2px 6px; border-radius: 10px; font-size: 0.7rem;">🔗 CONNECTION</span>',
+    'monitoring': '<span style="background: #6f42c1; color: white; padding: 2px 6px; border-radius: 10px; font-size: 0.7rem;">📊 MONITORING</span>'
+}
+
+def classify_tool_badges(tool_name, detailed):
+    """Determine tool type badges from the tool name"""
+    badges = ['detailed'] if detailed else []
+    tool_name_lower = tool_name.lower()
+    if 'wizard' in tool_name_lower:
+        badges.append('wizard')
+    if any(provider in tool_name_lower for provider in ['aws', 'azure', 'gcp', 'snowflake', 'databricks']):
+        badges.append('cloud')
+    if 'connection' in tool_name_lower:
+        badges.append('connection')
+    if any(word in tool_name_lower for word in ['monitor', 'health', 'audit']):
+        badges.append('monitoring')
+    return badges
+
+class ToolInfo:
+    """Compiled catalog entry; supports .get()/[] like the source dicts"""
+    
+    __slots__ = ('name', 'description', 'primary_api_calls', 'workflow_steps', 'key_features',
+                 'use_cases', 'response_format', 'detailed', 'on_server', 'parameters',
+                 'badges', 'badges_html', 'description_preview', 'key_features_text', 'api_text')
+    
+    def __init__(self, row):
+        for slot, value in zip(self.__slots__, row):
+            if isinstance(value, str):
+                value = sys.intern(value)
+            elif isinstance(value, (list, tuple)):
+                value = tuple(sys.intern(item) for item in value)
+            setattr(self, slot, value)
+    
+    def get(self, key, default=None):
+        value = getattr(self, key) if key in self.__slots__ else None
+        return default if value is None else value
+    
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+    
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+def compile_tool_info(tool_name, tool_info, detailed, server_tool=None):
+    """Compile one catalog entry into a ToolInfo row, precomputing its card fragments"""
+    description = tool_info.get('description', f'Advanced workflow tool for {tool_name.replace("_", " ").title()}')
+    # Clean any potential HTML content from descriptions
+    description_preview = clean_text_content(description)
+    if len(description_preview) > 150:
+        description_preview = description_preview[:150] + "..."
+    # First 3 features and the endpoint part of the first 2 API calls
+    key_features_text = ' • '.join(clean_text_content(feature)
+                                   for feature in tool_info.get('key_features', [])[:3])
+    api_text = ' • '.join(clean_text_content(api.split(' - ')[0])
+                          for api in tool_info.get('primary_api_calls', [])[:2])
+    badges = classify_tool_badges(tool_name, detailed)
+    parameters = None
+    if server_tool:
+        parameters = [
+            f"{parameter['name']} ({parameter['type']}{', required' if parameter['required'] else ''})"
+            + (f" - {parameter['description']}" if parameter['description'] else '')
+            for parameter in server_tool['parameters']
+        ]
+    return [
+        tool_name,
+        description,
+        tool_info.get('primary_api_calls'),
+        tool_info.get('workflow_steps'),
+        tool_info.get('key_features'),
+        tool_info.get('use_cases'),
+        tool_info.get('response_format'),
+        detailed,
+        server_tool is not None,
+        parameters,
+        badges,
+        ' '.join(TOOL_BADGES[badge] for badge in badges),
+        description_preview,
+        key_features_text,
+        api_text
+    ]
+
+def compile_tool_catalog():
+    """Compile every detailed, categorized and server-registered tool into ToolInfo rows"""
+    comprehensive = get_comprehensive_tool_info()
+    server_tools = {tool['name']: tool for tool in get_server_tools()}
+    tool_names = (list(comprehensive) + list(server_tools) +
+                  [tool for tools in get_tool_categories().values() for tool in tools])
+    rows = []
+    for tool in dict.fromkeys(tool_names):
+        tool_info = comprehensive.get(tool)
+        if tool_info is None:
+            tool_info = get_default_tool_info(tool)
+            # Prefer the description the server actually advertises
+            if server_tools.get(tool, {}).get('description'):
+                tool_info['description'] = server_tools[tool]['description']
+        rows.append(compile_tool_info(tool, tool_info, tool in comprehensive, server_tools.get(tool)))
+    return rows
+
+def catalog_source_hash():
+    """Hash of the showcase and MCP server sources the catalog is compiled from"""
+    sources = [Path(__file__).read_text(encoding='utf-8')]
+    if MCP_SERVER_SOURCE.exists():
+        sources.append(MCP_SERVER_SOURCE.read_text(encoding='utf-8'))
+    return content_hash('\0'.join(sources))
+
+def build_tool_catalog(path=CATALOG_ARTIFACT_PATH):
+    """Build step: write the compiled catalog as a compact JSON artifact"""
+    rows = compile_tool_catalog()
+    artifact = {
+        'format': CATALOG_FORMAT_VERSION,
+        'source_hash': catalog_source_hash(),
+        'slots': list(ToolInfo.__slots__),
+        'tools': rows
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    temp_path.write_text(json.dumps(artifact, ensure_ascii=False, separators=(',', ':')), encoding='utf-8')
+    temp_path.replace(path)
+    return rows
+
+class ToolCatalog:
+    """Compiled tool records by name, tagged with the source hash they were compiled from"""
     
-    col1, col2 = st.columns(2)
+    def __init__(self, rows, source_hash=None):
+        self.records = {row[0]: ToolInfo(row) for row in rows}
+        self.source_hash = source_hash
     
-    with col1:
-        if tool_info.get('key_features'):
-            st.markdown("#### 🎯 Key Features")
-            for feature in tool_info['key_features'][:5]:  # Show first 5 features
-                st.markdown(f"• {feature}")
+    def __contains__(self, tool_name):
+        return tool_name in self.records
     
-    with col2:
-        if tool_info.get('use_cases'):
-            st.markdown("#### 🚀 Use Cases")
-            for use_case in tool_info['use_cases'][:4]:  # Show first 4 use cases
-                st.markdown(f"• {use_case}")
+    def get(self, tool_name, default=None):
+        return self.records.get(tool_name, default)
     
+    def lookup(self, tool_name):
+        """Compiled record for a tool, falling back to generated default info"""
+        record = self.records.get(tool_name)
+        if record is None:
+            record = ToolInfo(compile_tool_info(tool_name, get_default_tool_info(tool_name), False))
+        return record
+
+@metered_cache('get_tool_catalog')
+def get_tool_catalog():
+    """Load the compiled catalog artifact, rebuilding it if missing or stale"""
+    source_hash = catalog_source_hash()
+    try:
+        artifact = json.loads(CATALOG_ARTIFACT_PATH.read_text(encoding='utf-8'))
+        fresh = (artifact.get('format') == CATALOG_FORMAT_VERSION and
+                 artifact.get('slots') == list(ToolInfo.__slots__) and
+                 artifact.get('source_hash') == source_hash)
+        rows = artifact['tools'] if fresh else None
+    except (OSError, ValueError, KeyError):
+        rows = None
+    if rows is None:
+        try:
+            rows = build_tool_catalog()
+        except OSError:
+            rows = compile_tool_catalog()
+    return ToolCatalog(rows, source_hash)
+
+# Relative weight of a match in each searchable field when ranking results
+SEARCH_FIELD_WEIGHTS = {
+    'name': 4,
+    'description': 2,
+    'key_features': 1,
+    'primary_api_calls': 1
+}
+
+def tokenize_search_text(text):
+    """Split text into lowercase alphanumeric tokens (underscores and punctuation split)"""
+    return re.findall(r'[a-z0-9]+', text.lower())
+
+class ToolSearchIndex:
+    """Token-prefix inverted index over tool names, descriptions, features and API calls"""
+    
+    def __init__(self, tool_names, catalog):
+        # prefix -> {tool: weight of the best field containing a token with that prefix}
+        self.postings = {}
+        for tool in tool_names:
+            tool_info = catalog.lookup(tool)
+            fields = {
+                'name': tool,
+                'description': tool_info.get('description', ''),
+                'key_features': ' '.join(tool_info.get('key_features', [])),
+                'primary_api_calls': ' '.join(tool_info.get('primary_api_calls', []))
+            }
+            for field, text in fields.items():
+                weight = SEARCH_FIELD_WEIGHTS[field]
+                for token in set(tokenize_search_text(text)):
+                    for end in range(1, len(token) + 1):
+                        posting = self.postings.setdefault(token[:end], {})
+                        if posting.get(tool, 0) < weight:
+                            posting[tool] = weight
+    
+    def search(self, query):
+        """Return {tool: score} for tools matching every query token, or None for an empty query"""
+        tokens = tokenize_search_text(query)
+        if not tokens:
+            return None
+        # Intersect the shortest posting lists first
+        postings = sorted((self.postings.get(token, {}) for token in tokens), key=len)
+        scores = dict(postings[0])
+        for posting in postings[1:]:
+            scores = {tool: score + posting[tool] for tool, score in scores.items() if tool in posting}
+            if not scores:
+                break
+        return scores
+
+@metered_cache('get_tool_search_index')
+def get_tool_search_index():
+    """Build the explorer search index once per process"""
+    tool_names = [tool for tools in get_tool_categories().values() for tool in tools]
+    return ToolSearchIndex(tool_names, get_tool_catalog())
+
+# Explorer filter facets
+STATUS_FILTERS = {
+    "✅ Verified": "verified",
+    "🟡 Partial": "partial",
+    "❌ Issues": "issue",
+    "⚪ Untested": "untested"
+}
+FEATURE_FILTER_KEYWORDS = {
+    "Wizards": ["wizard", "interactive", "step-by-step"],
+    "Authentication": ["auth", "oauth", "credentials", "token"],
+    "Cloud": ["aws", "azure", "gcp", "snowflake", "databricks", "cloud"],
+    "Monitoring": ["monitor", "health", "status", "track", "audit"],
+    "Export": ["export", "results", "download", "delivery"]
+}
+API_FEATURE_FILTERS = ["OAuth2", "Real-time", "Bulk Operations", "Webhooks", "Scheduled"]
+CLOUD_PROVIDER_FILTERS = ["AWS", "Google Cloud", "Azure", "Snowflake", "Databricks"]
+UNTESTED_STATUS = MappingProxyType({
+    'status': 'Not Tested',
+    'status_category': 'untested',
+    'issues': 'No testing data',
+    'priority': '-'
+})
+
+def count_bits(bits):
+    """Population count of a facet bitset"""
+    return bin(bits).count('1')
+
+def apply_quick_filter(keyword):
+    """Quick filter buttons replace the search term, which then stays until edited"""
+    st.session_state['explorer_search'] = keyword
+
+class ToolFacetIndex:
+    """One bitset per facet value over the explorer's tool entries
+    
+    Bit i stands for the i-th (category, tool) entry, so any filter
+    combination is a bitwise AND and every facet count is a popcount.
+    """
+    
+    def __init__(self, categories, catalog):
+        self.entries = [(category, tool) for category, tools in categories.items() for tool in tools]
+        self.all_bits = (1 << len(self.entries)) - 1
+        self.status_cache = None
+        self.tool_bits = {}
+        self.facets = {
+            'category': dict.fromkeys(categories, 0),
+            'feature': dict.fromkeys(FEATURE_FILTER_KEYWORDS, 0),
+            'api': dict.fromkeys(API_FEATURE_FILTERS, 0),
+            'provider': dict.fromkeys(CLOUD_PROVIDER_FILTERS, 0)
+        }
+        for position, (category, tool) in enumerate(self.entries):
+            bit = 1 << position
+            self.tool_bits[tool] = self.tool_bits.get(tool, 0) | bit
+            self.facets['category'][category] |= bit
+            
+            tool_info = catalog.lookup(tool)
+            description = tool_info.get('description', '').lower()
+            features = [feature.lower() for feature in tool_info.get('key_features', [])]
+            tool_text = f"{tool} {description} {' '.join(features)}".lower()
+            for feature, keywords in FEATURE_FILTER_KEYWORDS.items():
+                if any(keyword in tool.lower() or keyword in description or
+                       any(keyword in text for text in features) for keyword in keywords):
+                    self.facets['feature'][feature] |= bit
+            for api_feature in API_FEATURE_FILTERS:
+                if api_feature.lower() in tool_text:
+                    self.facets['api'][api_feature] |= bit
+            for provider in CLOUD_PROVIDER_FILTERS:
+                if provider.lower() in tool_text:
+                    self.facets['provider'][provider] |= bit
+    
+    def status_bits(self, snapshot):
+        """Bitsets per status category, computed once per status snapshot"""
+        cached = self.status_cache
+        if cached and cached[0] == snapshot.fingerprint:
+            return cached[1]
+        bits = dict.fromkeys(STATUS_FILTERS.values(), 0)
+        for position, (_, tool) in enumerate(self.entries):
+            status_category = snapshot.status_lookup.get(tool, UNTESTED_STATUS).get('status_category')
+            if status_category in bits:
+                bits[status_category] |= 1 << position
+        self.status_cache = (snapshot.fingerprint, bits)
+        return bits
+    
+    def bits_for(self, tools):
+        """Bitset of every entry for the given tool names"""
+        bits = 0
+        for tool in tools:
+            bits |= self.tool_bits.get(tool, 0)
+        return bits
+    
+    def any_of(self, facet, options):
+        """OR of the selected options of a multi-select facet, or None when nothing is selected"""
+        if not options:
+            return None
+        bits = 0
+        for option in options:
+            bits |= self.facets[facet][option]
+        return bits
+    
+    def combine(self, masks, skip=None):
+        """AND every active facet mask, optionally leaving one facet out (for its counts)"""
+        bits = self.all_bits
+        for facet, mask in masks.items():
+            if facet != skip and mask is not None:
+                bits &= mask
+        return bits
+
+@metered_cache('get_tool_facet_index')
+def get_tool_facet_index():
+    """Build the explorer facet bitsets once per process"""
+    return ToolFacetIndex(get_tool_categories(), get_tool_catalog())
+
+# Rebuild everything derived from the server's tool list when index.ts changes
+WATCHED_DOC_CACHES[str(MCP_SERVER_SOURCE)] = [
+    get_tool_categories, get_tool_catalog, get_tool_search_index, get_tool_facet_index
+]
+WATCHED_DOC_PAGES[str(MCP_SERVER_SOURCE)] = ["🛠️ MCP Tools Explorer", "📊 Testing Dashboard"]
+
+# Detail panels are composed as blocks -- ('markdown', text), ('info', text),
+# ('code', text, language) or ('columns', (left, right)) -- so they can be
+# cached per tool and drawn in one pass
+TOOL_PANELS = {'details': "📖 Details", 'quick': "⚡ Quick Info", 'api': "🔌 API"}
+
+def compact_blocks(blocks):
+    """Merge consecutive markdown blocks so a panel renders with fewer elements"""
+    compacted = []
+    for block in blocks:
+        if block[0] == 'columns':
+            block = ('columns', tuple(compact_blocks(column) for column in block[1]))
+        if block[0] == 'markdown' and compacted and compacted[-1][0] == 'markdown':
+            compacted[-1] = ('markdown', compacted[-1][1] + "\n\n" + block[1])
+        else:
+            compacted.append(block)
+    return tuple(compacted)
+
+def quick_info_blocks(tool_name, tool_info):
+    """Quick overview of tool information in a compact format"""
+    left, right = [], []
+    if tool_info.get('key_features'):
+        left.append(('markdown', "#### 🎯 Key Features"))
+        for feature in tool_info['key_features'][:5]:  # Show first 5 features
+            left.append(('markdown', f"• {feature}"))
+    if tool_info.get('use_cases'):
+        right.append(('markdown', "#### 🚀 Use Cases"))
+        for use_case in tool_info['use_cases'][:4]:  # Show first 4 use cases
+            right.append(('markdown', f"• {use_case}"))
+    
+    blocks = [('markdown', f"### ⚡ Quick Info: {tool_name}"), ('columns', (left, right))]
     if tool_info.get('workflow_steps'):
-        st.markdown("#### 🔄 Workflow Overview")
-        for i, step in enumerate(tool_info['workflow_steps'][:4], 1):  # Show first 4 steps
-            st.markdown(f"{step}")
+        blocks.append(('markdown', "#### 🔄 Workflow Overview"))
+        for step in tool_info['workflow_steps'][:4]:  # Show first 4 steps
+            blocks.append(('markdown', f"{step}"))
+    return compact_blocks(blocks)
 
-def show_api_info(tool_name, tool_info):
-    """Show API information for a tool"""
-    st.markdown(f"### 🔌 API Details: {tool_name}")
-    
+def api_info_blocks(tool_name, tool_info):
+    """API information for a tool"""
+    blocks = [('markdown', f"### 🔌 API Details: {tool_name}")]
     if tool_info.get('primary_api_calls'):
-        st.markdown("#### API Endpoints")
+        blocks.append(('markdown', "#### API Endpoints"))
         for api_call in tool_info['primary_api_calls']:
             # Parse API call format: "METHOD /endpoint - Description"
             if ' - ' in api_call:
                 endpoint, description = api_call.split(' - ', 1)
-                st.code(endpoint, language='http')
-                st.markdown(f"_{description}_")
+                blocks.append(('code', endpoint, 'http'))
+                blocks.append(('markdown', f"_{description}_"))
             else:
-                st.code(api_call, language='http')
+                blocks.append(('code', api_call, 'http'))
     
     if tool_info.get('response_format'):
-        st.markdown("#### Response Format")
-        st.info(tool_info['response_format'])
+        blocks.append(('markdown', "#### Response Format"))
+        blocks.append(('info', tool_info['response_format']))
+    return compact_blocks(blocks)
 
-def show_tool_details(tool_name, status_info):
-    """Show comprehensive information about a specific tool"""
-    st.markdown(f"### 🔧 {tool_name}")
-    
-    # Get comprehensive tool info
-    tool_info = get_comprehensive_tool_info().get(tool_name, {})
-    
+def tool_details_blocks(tool_name, status_info, tool_info):
+    """Comprehensive information about a specific tool"""
     # Testing Status Section
-    st.markdown("#### 📊 Testing Status")
-    col1, col2 = st.columns(2)
-    with col1:
-        status_color = "🟢" if "Verified" in status_info['status'] else "🟡" if "Complete" in status_info['status'] else "🔴" if "issue" in status_info.get('status_category', '') else "⚪"
-        st.markdown(f"**Status:** {status_color} {status_info['status']}")
-        st.markdown(f"**Category:** {status_info['status_category'].title()}")
-    with col2:
-        st.markdown(f"**Issues:** {status_info.get('issues', 'None')}")
-        st.markdown(f"**Priority:** {status_info.get('priority', 'Not set')}")
+    status_color = "🟢" if "Verified" in status_info['status'] else "🟡" if "Complete" in status_info['status'] else "🔴" if "issue" in status_info.get('status_category', '') else "⚪"
+    blocks = [
+        ('markdown', f"### 🔧 {tool_name}"),
+        ('markdown', "#### 📊 Testing Status"),
+        ('columns', (
+            [('markdown', f"**Status:** {status_color} {status_info['status']}"),
+             ('markdown', f"**Category:** {status_info['status_category'].title()}")],
+            [('markdown', f"**Issues:** {status_info.get('issues', 'None')}"),
+             ('markdown', f"**Priority:** {status_info.get('priority', 'Not set')}")]
+        ))
+    ]
     
     # Tool Description Section
     if tool_info.get('description'):
-        st.markdown("#### 📖 What This Tool Does")
-        st.info(tool_info['description'])
+        blocks.append(('markdown', "#### 📖 What This Tool Does"))
+        blocks.append(('info', tool_info['description']))
     
     # Technical Architecture Section
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        if tool_info.get('primary_api_calls'):
-            st.markdown("#### 🔌 API Calls")
-            for api_call in tool_info['primary_api_calls']:
-                st.markdown(f"• `{api_call}`")
-        
-        if tool_info.get('key_features'):
-            st.markdown("#### ⚡ Key Features")
-            for feature in tool_info['key_features']:
-                st.markdown(f"• {feature}")
-    
-    with col2:
-        if tool_info.get('workflow_steps'):
-            st.markdown("#### 🔄 Workflow Steps")
-            for step in tool_info['workflow_steps']:
-                st.markdown(f"{step}")
-        
-        if tool_info.get('use_cases'):
-            st.markdown("#### 🎯 Use Cases")
-            for use_case in tool_info['use_cases']:
-                st.markdown(f"• {use_case}")
+    left, right = [], []
+    if tool_info.get('primary_api_calls'):
+        left.append(('markdown', "#### 🔌 API Calls"))
+        left.extend(('markdown', f"• `{api_call}`") for api_call in tool_info['primary_api_calls'])
+    if tool_info.get('key_features'):
+        left.append(('markdown', "#### ⚡ Key Features"))
+        left.extend(('markdown', f"• {feature}") for feature in tool_info['key_features'])
+    if tool_info.get('workflow_steps'):
+        right.append(('markdown', "#### 🔄 Workflow Steps"))
+        right.extend(('markdown', f"{step}") for step in tool_info['workflow_steps'])
+    if tool_info.get('use_cases'):
+        right.append(('markdown', "#### 🎯 Use Cases"))
+        right.extend(('markdown', f"• {use_case}") for use_case in tool_info['use_cases'])
+    if left or right:
+        blocks.append(('columns', (left, right)))
+    
+    # Input parameters advertised by the MCP server
+    if tool_info.get('parameters'):
+        blocks.append(('markdown', "#### 🧩 Parameters"))
+        blocks.extend(('markdown', f"• `{parameter}`") for parameter in tool_info['parameters'])
     
     # Response Format
     if tool_info.get('response_format'):
-        st.markdown("#### 📄 Response Format")
-        st.code(tool_info['response_format'], language='text')
+        blocks.append(('markdown', "#### 📄 Response Format"))
+        blocks.append(('code', tool_info['response_format'], 'text'))
     
     # Testing Details Section (if available)
     if 'detailed_status' in status_info:
-        st.markdown("#### 🧪 Testing Details")
-        st.info(status_info['detailed_status'])
+        blocks.append(('markdown', "#### 🧪 Testing Details"))
+        blocks.append(('info', status_info['detailed_status']))
     
     # Working components
-    if 'working_components' in status_info and status_info['working_components']:
-        st.markdown("#### ✅ Working Components")
-        for component in status_info['working_components']:
-            st.markdown(f"• {component}")
+    if status_info.get('working_components'):
+        blocks.append(('markdown', "#### ✅ Working Components"))
+        blocks.extend(('markdown', f"• {component}") for component in status_info['working_components'])
     
     # Current issues
-    if 'current_issues' in status_info and status_info['current_issues']:
-        st.markdown("#### ❌ Current Issues")
-        for issue in status_info['current_issues']:
-            st.markdown(f"• {issue}")
+    if status_info.get('current_issues'):
+        blocks.append(('markdown', "#### ❌ Current Issues"))
+        blocks.extend(('markdown', f"• {issue}") for issue in status_info['current_issues'])
     
     # Technical details from testing
     if 'technical_details' in status_info:
-        st.markdown("#### 🔍 Technical Testing Details")
-        st.code(status_info['technical_details'])
+        blocks.append(('markdown', "#### 🔍 Technical Testing Details"))
+        blocks.append(('code', status_info['technical_details'], None))
     
     # Next steps
-    if 'next_steps' in status_info and status_info['next_steps']:
-        st.markdown("#### 🎯 Next Steps")
-        for step in status_info['next_steps']:
-            st.markdown(f"• {step}")
+    if status_info.get('next_steps'):
+        blocks.append(('markdown', "#### 🎯 Next Steps"))
+        blocks.extend(('markdown', f"• {step}") for step in status_info['next_steps'])
+    return compact_blocks(blocks)
 
-def show_testing_dashboard():
-    st.header("📊 Testing Dashboard")
-    
-    # Parse testing data
-    tool_status = parse_tool_testing_status()
-    completed_tools = parse_testing_progress()
+@metered_cache('get_tool_panels', max_entries=512)
+def get_tool_panels(tool_name, status_fingerprint, catalog_hash, *, _snapshot, _catalog):
+    """All detail panels for one tool, keyed by the data versions they were built from
+    
+    Only panels that have content are present. Built from the snapshot and
+    catalog those versions were read from.
+    """
+    status_info = _snapshot.status_lookup.get(tool_name, UNTESTED_STATUS)
+    record = _catalog.lookup(tool_name)
+    panels = {'details': tool_details_blocks(tool_name, status_info,
+                                             record if record.detailed or record.on_server else {})}
+    if record.detailed:
+        panels['quick'] = quick_info_blocks(tool_name, record)
+    if record.get('primary_api_calls'):
+        panels['api'] = api_info_blocks(tool_name, record)
+    return MappingProxyType(panels)
+
+def show_panel_blocks(blocks):
+    """Draw a composed detail panel"""
+    for block in blocks:
+        kind = block[0]
+        if kind == 'columns':
+            for column, column_blocks in zip(st.columns(len(block[1])), block[1]):
+                with column:
+                    show_panel_blocks(column_blocks)
+        elif kind == 'info':
+            st.info(block[1])
+        elif kind == 'code':
+            st.code(block[1], language=block[2])
+        else:
+            st.markdown(block[1])
+
+@st.dialog("🔧 Tool Details", width="large")
+def show_tool_dialog(tool_name, panel):
+    """Detail panels for one tool; switching panels reruns only the dialog"""
+    snapshot, catalog = get_status_snapshot(), get_tool_catalog()
+    panels = get_tool_panels(tool_name, snapshot.fingerprint, catalog.source_hash, _snapshot=snapshot, _catalog=catalog)
+    panel = st.radio("Show:", list(panels), index=list(panels).index(panel) if panel in panels else 0,
+                     format_func=TOOL_PANELS.get, horizontal=True, key=f"dialog_panel_{tool_name}")
+    show_panel_blocks(panels[panel])
+
+TestingFrames = namedtuple('TestingFrames', ['tools', 'status_counts', 'category_status'])
+
+@timed('build_testing_frames')
+def build_testing_frames(categories, tool_status, completed_tools):
+    """Join categories with status and completed rows as frames instead of nested scans
+    
+    Precedence per tool: listed in TESTING_PROGRESS.md -> verified, otherwise the
+    first MCP_TOOL_TESTING_STATUS.md record for it, otherwise untested.
+    """
+    import pandas as pd
+    
+    tools = pd.DataFrame(
+        [(tool, category.split(' (')[0]) for category, category_tools in categories.items()
+         for tool in category_tools],  # Remove count from the category label
+        columns=['tool', 'category']
+    )
+    status_rows = pd.DataFrame({
+        'tool': [record['name'] for record in tool_status],
+        'status': [record.get('status_category', 'untested') for record in tool_status]
+    }).drop_duplicates('tool')
+    completed = pd.Index([record['name'] for record in completed_tools])
+    
+    tools = tools.merge(status_rows, on='tool', how='left')
+    tools['status'] = tools['status'].fillna('untested').where(~tools['tool'].isin(completed), 'verified')
+    
+    return TestingFrames(
+        tools,
+        tools['status'].value_counts(),
+        tools.groupby(['category', 'status']).size().unstack(fill_value=0)
+    )
+
+@metered_cache('get_testing_frames', max_entries=4)
+def get_testing_frames(status_fingerprint, category_key, *, _snapshot):
+    """Dashboard frames for one status snapshot and category layout
+    
+    Built from the snapshot the fingerprint was taken from, never a newer one
+    a background refresh has put in place since.
+    """
+    return build_testing_frames(dict(category_key), _snapshot.tool_status, _snapshot.completed_tools)
+
+STATUS_COLORS = {'verified': '#28a745', 'partial': '#ffc107', 'issue': '#dc3545', 'untested': '#6c757d'}
+
+@timed('build_dashboard_figures')
+def build_dashboard_figures(frames):
+    """Status pie and category stacked bar charts for the Testing Dashboard"""
+    import plotly.express as px
+    import plotly.graph_objects as go
+    
+    # Create pie chart
+    status_counts = frames.status_counts
+    status_figure = px.pie(
+        values=status_counts.values, 
+        names=status_counts.index,
+        color_discrete_map=STATUS_COLORS,
+        title="Tool Testing Status Distribution"
+    )
     
-    # Create comprehensive status data
-    all_tools = []
+    # Create stacked bar chart
+    category_status = frames.category_status
+    category_figure = go.Figure()
+    for status in category_status.columns:
+        category_figure.add_trace(go.Bar(
+            name=status.title(),
+            x=category_status.index,
+            y=category_status[status],
+            marker_color=STATUS_COLORS.get(status, '#6c757d')
+        ))
+    
+    category_figure.update_layout(
+        barmode='stack',
+        title="Testing Status by Category",
+        xaxis_tickangle=-45
+    )
+    return status_figure, category_figure
+
+@metered_cache('get_dashboard_figures', max_entries=4)
+def get_dashboard_figures(status_fingerprint, category_key, *, _snapshot):
+    """Dashboard figures built once per status snapshot and shared read-only across sessions
+    
+    Figure objects rather than dict specs are kept: st.plotly_chart re-validates
+    a dict by rebuilding the figure, but serializes a Figure directly.
+    """
+    return build_dashboard_figures(get_testing_frames(status_fingerprint, category_key, _snapshot=_snapshot))
+
+def testing_data_key(snapshot):
+    """Cache key for the dashboard: status fingerprint plus the category layout"""
     categories = get_tool_categories()
-    
-    # Flatten all tools with categories
-    for category, tools in categories.items():
-        for tool in tools:
-            all_tools.append({
-                'tool': tool,
-                'category': category.split(' (')[0],  # Remove count
-                'status': 'untested'
-            })
-    
-    # Update with actual status
-    for tool_data in all_tools:
-        tool_name = tool_data['tool']
-        
-        # Check in tool_status first
-        for status_tool in tool_status:
-            if status_tool['name'] == tool_name:
-                tool_data['status'] = status_tool.get('status_category', 'untested')
-                break
-        
-        # Check in completed_tools
-        for completed_tool in completed_tools:
-            if completed_tool['name'] == tool_name:
-                tool_data['status'] = 'verified'
-                break
-    
-    # Create DataFrame
-    df = pd.DataFrame(all_tools)
-    
-    # Overall statistics
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.subheader("📈 Testing Progress")
-        status_counts = df['status'].value_counts()
-        
-        # Create pie chart
-        fig = px.pie(
-            values=status_counts.values, 
-            names=status_counts.index,
-            color_discrete_map={
-                'verified': '#28a745',
-                'partial': '#ffc107', 
-                'issue': '#dc3545',
-                'untested': '#6c757d'
-            },
-            title="Tool Testing Status Distribution"
-        )
-        st.plotly_chart(fig, use_container_width=True)
-    
-    with col2:
-        st.subheader("📊 Progress by Category")
-        category_status = df.groupby(['category', 'status']).size().unstack(fill_value=0)
-        
-        # Create stacked bar chart
-        fig = go.Figure()
-        
-        colors = {'verified': '#28a745', 'partial': '#ffc107', 'issue': '#dc3545', 'untested': '#6c757d'}
-        for status in category_status.columns:
-            fig.add_trace(go.Bar(
-                name=status.title(),
-                x=category_status.index,
-                y=category_status[status],
-                marker_color=colors.get(status, '#6c757d')
-            ))
-        
-        fig.update_layout(
-            barmode='stack',
-            title="Testing Status by Category",
-            xaxis_tickangle=-45
-        )
-        st.plotly_chart(fig, use_container_width=True)
-    
-    # Detailed status table
+    return (snapshot.fingerprint,
+            tuple((category, tuple(tools)) for category, tools in categories.items()))
+
+@st.fragment
+@timed('show_testing_table')
+def show_testing_table(df):
+    """Filterable status table; a filter change reruns only this region"""
     st.subheader("📋 Detailed Testing Status")
     
     # Filter options
     col1, col2 = st.columns(2)
     with col1:
-        selected_category = st.selectbox("Filter by Category:", ["All"] + list(df['category'].unique()))
+        selected_category = st.selectbox("Filter by Category:", ["All"] + list(df['category'].unique()),
+                                         key="dashboard_category")
     with col2:
-        selected_status = st.selectbox("Filter by Status:", ["All"] + list(df['status'].unique()))
+        selected_status = st.selectbox("Filter by Status:", ["All"] + list(df['status'].unique()),
+                                       key="dashboard_status")
     
     # Apply filters
     filtered_df = df.copy()
@@ -2122,23 +3606,103 @@ def show_testing_dashboard():
     
     # Display filtered table
     st.dataframe(filtered_df, use_container_width=True)
+
+@metered_cache('get_history_figure', max_entries=2)
+def get_history_figure(version):
+    """Step chart of verified/partial/issue counts over time for one history version"""
+    import plotly.graph_objects as go
+    
+    timeline = get_status_history(version).timeline
+    times = [datetime.fromtimestamp(row[0]) for row in timeline]
+    figure = go.Figure()
+    for column, status in enumerate(['verified', 'partial', 'issue'], 1):
+        figure.add_trace(go.Scatter(
+            name=status.title(),
+            x=times,
+            y=[row[column] for row in timeline],
+            mode='lines+markers',
+            line_shape='hv',
+            marker_color=STATUS_COLORS[status]
+        ))
+    figure.update_layout(title="Testing Status Over Time", yaxis_title="Tools")
+    return figure
+
+@st.fragment
+@timed('show_status_history')
+def show_status_history():
+    """Counts over time and per-tool status transitions from the history store"""
+    st.subheader("🕒 Progress Over Time")
+    version = status_history_version()
+    if not version[0]:
+        st.info("No status history recorded yet.")
+        return
+    
+    try:
+        history = get_status_history(version)
+    except (sqlite3.Error, OSError) as e:
+        st.warning(f"Status history unavailable: {e}")
+        return
+    st.plotly_chart(get_history_figure(version), use_container_width=True)
+    st.caption(f"{history.snapshots} distinct snapshots recorded · {len(history.timeline)} points shown")
+    
+    st.markdown("**🔀 Status Transitions**")
+    tools = sorted({transition[1] for transition in history.transitions})
+    selected_tool = st.selectbox("Filter by Tool:", ["All"] + tools, key="dashboard_history_tool")
+    transitions = [transition for transition in history.transitions
+                   if selected_tool == "All" or transition[1] == selected_tool]
+    if transitions:
+        st.dataframe([{'changed': datetime.fromtimestamp(changed).strftime("%Y-%m-%d %H:%M"), 'tool': tool,
+                       'from': before, 'to': after}
+                      for changed, tool, before, after in transitions[:200]], use_container_width=True)
+    else:
+        st.markdown("_No status changes recorded yet._")
+
+@timed('show_testing_dashboard')
+def show_testing_dashboard():
+    st.header("📊 Testing Dashboard")
+    
+    # Merged frames and figures, rebuilt only when the status data changes
+    snapshot = get_status_snapshot()
+    data_key = testing_data_key(snapshot)
+    frames = get_testing_frames(*data_key, _snapshot=snapshot)
+    df = frames.tools
+    status_figure, category_figure = get_dashboard_figures(*data_key, _snapshot=snapshot)
+    
+    # Overall statistics
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("📈 Testing Progress")
+        status_counts = frames.status_counts
+        st.plotly_chart(status_figure, use_container_width=True)
+    
+    with col2:
+        st.subheader("📊 Progress by Category")
+        st.plotly_chart(category_figure, use_container_width=True)
+    
+    # Detailed status table
+    show_testing_table(df)
     
     # Key metrics
     st.subheader("🎯 Key Metrics")
-    verified_count = len(df[df['status'] == 'verified'])
+    verified_count = int(status_counts.get('verified', 0))
     total_count = len(df)
-    completion_rate = (verified_count / total_count) * 100
+    completion_rate = (verified_count / total_count) * 100 if total_count else 0
     
     col1, col2, col3 = st.columns(3)
     with col1:
         st.metric("Tools Verified", f"{verified_count}/{total_count}", f"{completion_rate:.1f}%")
     with col2:
-        partial_count = len(df[df['status'] == 'partial'])
+        partial_count = int(status_counts.get('partial', 0))
         st.metric("Partial Testing", partial_count)
     with col3:
-        issue_count = len(df[df['status'] == 'issue'])
+        issue_count = int(status_counts.get('issue', 0))
         st.metric("Issues Found", issue_count)
+    
+    # Status history
+    show_status_history()
 
+@timed('show_key_learnings')
 def show_key_learnings():
     st.header("🧠 Key Learnings")
     
@@ -2184,6 +3748,7 @@ def show_key_learnings():
         </div>
         """, unsafe_allow_html=True)
 
+@timed('show_limitations')
 def show_limitations():
     st.header("⚠️ Known Limitations")
     
@@ -2244,6 +3809,7 @@ def show_limitations():
         </div>
         """, unsafe_allow_html=True)
 
+@timed('show_work_to_do')
 def show_work_to_do():
     st.header("🎯 Work To Do")
     
@@ -2304,35 +3870,36 @@ def show_work_to_do():
     with col3:
         st.metric("Documentation", "Clean up needed", "~15 files to organize")
 
+# Documentation Hub entries, organized by importance
+DOCUMENTATION_SECTIONS = {
+    "🎯 Project Overview": {
+        "README.md": "Main project overview and status",
+        "MISSION_ACCOMPLISHED.md": "Universal name resolution achievement",
+        "IMPLEMENTATION_COMPLETE_SUMMARY.md": "Enterprise platform implementation"
+    },
+    "🧪 Testing & Validation": {
+        "MCP_TOOL_TESTING_STATUS.md": "Detailed technical testing results and issues",
+        "TESTING_PROGRESS.md": "Testing methodology and progress tracking",
+        "UUID_AUDIT_REPORT.md": "Analysis of name resolution enhancements"
+    },
+    "🔧 Technical Implementation": {
+        "MCP_SERVER_CONFIGURATION.md": "Setup guide for collaborators",
+        "API_COVERAGE_ANALYSIS.md": "Comprehensive API endpoint analysis",
+        ".memex/rules.md": "Project rules and architecture guidelines"
+    },
+    "📋 Planning & History": {
+        "HABU_MCP_COMPREHENSIVE_PLAN.md": "Original comprehensive development plan",
+        "NEW_WIZARDS_COMPLETION_SUMMARY.md": "Latest feature additions",
+        "SMART_DETECTION_BREAKTHROUGH.md": "Intelligent parameter detection"
+    }
+}
+
+@timed('show_documentation_hub')
 def show_documentation_hub():
     st.header("📚 Documentation Hub")
     st.markdown("Access all critical project documents")
     
-    # Organize docs by importance
-    critical_docs = {
-        "🎯 Project Overview": {
-            "README.md": "Main project overview and status",
-            "MISSION_ACCOMPLISHED.md": "Universal name resolution achievement",
-            "IMPLEMENTATION_COMPLETE_SUMMARY.md": "Enterprise platform implementation"
-        },
-        "🧪 Testing & Validation": {
-            "MCP_TOOL_TESTING_STATUS.md": "Detailed technical testing results and issues",
-            "TESTING_PROGRESS.md": "Testing methodology and progress tracking",
-            "UUID_AUDIT_REPORT.md": "Analysis of name resolution enhancements"
-        },
-        "🔧 Technical Implementation": {
-            "MCP_SERVER_CONFIGURATION.md": "Setup guide for collaborators",
-            "API_COVERAGE_ANALYSIS.md": "Comprehensive API endpoint analysis",
-            ".memex/rules.md": "Project rules and architecture guidelines"
-        },
-        "📋 Planning & History": {
-            "HABU_MCP_COMPREHENSIVE_PLAN.md": "Original comprehensive development plan",
-            "NEW_WIZARDS_COMPLETION_SUMMARY.md": "Latest feature additions",
-            "SMART_DETECTION_BREAKTHROUGH.md": "Intelligent parameter detection"
-        }
-    }
-    
-    for section, docs in critical_docs.items():
+    for section, docs in DOCUMENTATION_SECTIONS.items():
         with st.expander(section, expanded=True):
             for filename, description in docs.items():
                 col1, col2 = st.columns([3, 1])
@@ -2340,14 +3907,555 @@ def show_documentation_hub():
                     st.markdown(f"**{filename}**")
                     st.markdown(f"_{description}_")
                 with col2:
-                    if st.button(f"📖 View", key=filename):
-                        show_document_content(filename)
+                    is_open = st.session_state.get('hub_document') == filename
+                    st.button("✖️ Close" if is_open else "📖 View", key=filename,
+                              on_click=toggle_hub_document, args=(filename,))
+                if is_open:
+                    show_document_content(filename)
+
+DocumentSection = namedtuple('DocumentSection', ['level', 'title', 'start', 'end', 'lines'])
+DocumentIndex = namedtuple('DocumentIndex', ['sections', 'lines', 'size'])
+
+DOCUMENT_HEADING = re.compile(rb'^(#{1,3})\s+(.+?)[\s#]*$')
+DOCUMENT_PAGE_LINES = int(os.environ.get('HABU_SHOWCASE_DOC_PAGE_LINES', '150'))
+
+@st.cache_resource
+def get_document_index_cache():
+    """Filename -> ((mtime_ns, size), DocumentIndex); module globals start empty on every rerun"""
+    return {}
+
+@timed('index_document')
+def index_document(filename):
+    """Byte offsets of every #, ## and ### section, rebuilt only when the file changes; None if missing"""
+    path = Path(filename)
+    cache = get_document_index_cache()
+    try:
+        stat = path.stat()
+    except OSError:
+        cache.pop(filename, None)
+        return None
+    
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = cache.get(filename)
+    if cached and cached[0] == signature:
+        return cached[1]
+    
+    headings, offset, line_count, in_fence = [], 0, 0, False
+    with open(path, 'rb') as f:
+        for line in f:
+            if line.lstrip().startswith((b'```', b'~~~')):
+                in_fence = not in_fence
+            elif not in_fence:
+                match = DOCUMENT_HEADING.match(line)
+                if match:
+                    headings.append((len(match.group(1)), match.group(2).decode('utf-8', 'replace'), offset, line_count))
+            offset += len(line)
+            line_count += 1
+    
+    # Text before the first heading gets its own opening section
+    if not headings or headings[0][2] > 0:
+        headings.insert(0, (1, "(Top of document)", 0, 0))
+    bounds = headings[1:] + [(0, "", offset, line_count)]
+    index = DocumentIndex(
+        tuple(DocumentSection(level, title, start, end, end_line - first_line)
+              for (level, title, start, first_line), (_, _, end, end_line) in zip(headings, bounds)),
+        line_count,
+        offset
+    )
+    cache[filename] = (signature, index)
+    return index
+
+def read_document_range(filename, start, end):
+    """Read one section of a document without loading the rest"""
+    with open(filename, 'rb') as f:
+        f.seek(start)
+        return f.read(end - start).decode('utf-8', 'replace')
+
+def paginate_markdown(text, page_lines=DOCUMENT_PAGE_LINES):
+    """Split markdown into pages of roughly page_lines lines, never inside a code fence"""
+    pages, current, in_fence = [], [], False
+    for line in text.splitlines(keepends=True):
+        current.append(line)
+        if line.lstrip().startswith(('```', '~~~')):
+            in_fence = not in_fence
+        if len(current) >= page_lines and not in_fence:
+            pages.append("".join(current))
+            current = []
+    if current or not pages:
+        pages.append("".join(current))
+    return pages
+
+def toggle_hub_document(filename):
+    """Open a document in the hub viewer, or close it if it is already open"""
+    open_document = st.session_state.get('hub_document')
+    st.session_state['hub_document'] = None if open_document == filename else filename
 
+@timed('show_document_content')
 def show_document_content(filename):
-    """Display document content in an expander"""
-    content = load_markdown_file(filename)
+    """Display a document in an expander, one section or page at a time
+    
+    Small documents render whole; larger ones get a table of contents and only
+    the selected section (paginated when long) is read and sent to the browser.
+    """
+    document = index_document(filename)
     with st.expander(f"📄 {filename}", expanded=True):
-        st.markdown(content)
+        if document is None:
+            st.markdown(load_markdown_file(filename))
+            return
+        if document.lines <= DOCUMENT_PAGE_LINES:
+            st.markdown(read_document_range(filename, 0, document.size))
+            return
+        
+        sections = document.sections
+        st.caption(f"{document.lines} lines · {len(sections)} sections")
+        position = st.selectbox(
+            "📑 Contents", range(len(sections)), key=f"doc_section_{filename}",
+            format_func=lambda i: "\u2003" * (sections[i].level - 1) + f"{sections[i].title} ({sections[i].lines} lines)"
+        )
+        section = sections[position]
+        pages = paginate_markdown(read_document_range(filename, section.start, section.end))
+        page = 1
+        if len(pages) > 1:
+            page = st.number_input(f"Page (of {len(pages)})", min_value=1, max_value=len(pages),
+                                   key=f"doc_page_{filename}_{position}")
+        st.markdown(pages[page - 1])
+
+# Cache warm-up: Streamlit has no server start hook, so the first script run of
+# a process starts the warmer and later visitors find the shared caches hot
+# Readiness file for orchestrators: the server withdraws it when its warm-up
+# starts and writes it once every step has run. Servers sharing a cache
+# directory each need their own HABU_SHOWCASE_REPLICA (e.g. the pod name).
+SHOWCASE_REPLICA = os.environ.get('HABU_SHOWCASE_REPLICA', '')
+READY_FILE = Path(os.environ.get(
+    'HABU_SHOWCASE_READY_FILE',
+    PARSE_CACHE_DIR / (f'ready-{SHOWCASE_REPLICA}.json' if SHOWCASE_REPLICA else 'ready.json')
+))
+
+def warm_explorer():
+    """Default explorer view plus the first page of cards and their detail panels"""
+    snapshot = get_status_snapshot()
+    catalog = get_tool_catalog()
+    visible_tools = get_explorer_view(DEFAULT_EXPLORER_SELECTION, snapshot, catalog).ordered_tools[:EXPLORER_PAGE_SIZE]
+    page_categories = {}
+    for category, tool in visible_tools:
+        page_categories.setdefault(category, []).append(tool)
+        get_tool_panels(tool, snapshot.fingerprint, catalog.source_hash, _snapshot=snapshot, _catalog=catalog)
+    for page_tools in page_categories.values():
+        get_category_cards_html(tuple(page_tools), snapshot.fingerprint, catalog.source_hash,
+                                _snapshot=snapshot, _catalog=catalog)
+
+def warm_dashboard():
+    """Testing Dashboard frames and figures for the current snapshot"""
+    snapshot = get_status_snapshot()
+    get_dashboard_figures(*testing_data_key(snapshot), _snapshot=snapshot)
+
+def warm_documents():
+    """File metadata and heading indexes for the overview and Documentation Hub"""
+    get_file_update_info()
+    for docs in DOCUMENTATION_SECTIONS.values():
+        for filename in docs:
+            index_document(filename)
+
+def cache_warm_steps():
+    """(name, step) pairs in the order the warmer runs them"""
+    return [
+        ("status documents", get_status_snapshot),
+        ("tool categories", get_tool_categories),
+        ("tool catalog", get_tool_catalog),
+        ("search index", get_tool_search_index),
+        ("facet index", get_tool_facet_index),
+        ("explorer", warm_explorer),
+        ("dashboard", warm_dashboard),
+        ("documents", warm_documents)
+    ]
+
+class CacheWarmer:
+    """Run the warm-up steps on a background thread and report readiness
+    
+    Readiness is the `ready` event in-process and, for orchestrators, a JSON
+    file (replica, pid, timings, errors) written once every step has run and
+    removed again when the process exits. A step that fails is left cold and
+    computed on demand as before.
+    """
+    
+    def __init__(self, steps, ready_file=READY_FILE):
+        self.steps = steps
+        self.ready_file = ready_file
+        self.ready = threading.Event()
+        self.timings = {}
+        self.errors = {}
+        self.thread = threading.Thread(target=self.run, name="showcase-cache-warmer", daemon=True)
+    
+    def start(self):
+        # A report left behind by an earlier server no longer holds
+        self.withdraw()
+        if self.ready_file is not None:
+            atexit.register(self.withdraw)
+        self.thread.start()
+        return self
+    
+    def withdraw(self):
+        """Remove this replica's readiness report"""
+        if self.ready_file is not None:
+            try:
+                self.ready_file.unlink()
+            except OSError:
+                pass
+    
+    def run(self):
+        for name, step in self.steps:
+            started = time.perf_counter()
+            try:
+                step()
+            except Exception as e:
+                self.errors[name] = str(e)
+            self.timings[name] = time.perf_counter() - started
+        if self.ready_file is not None:
+            # Written atomically so a probe never reads a partial report
+            temporary = self.ready_file.with_name(f"{self.ready_file.name}.{os.getpid()}.tmp")
+            try:
+                self.ready_file.parent.mkdir(parents=True, exist_ok=True)
+                temporary.write_text(json.dumps({
+                    'replica': SHOWCASE_REPLICA or None,
+                    'pid': os.getpid(),
+                    'ready_at': datetime.now().isoformat(timespec='seconds'),
+                    'timings_ms': {name: round(seconds * 1000, 1) for name, seconds in self.timings.items()},
+                    'errors': self.errors
+                }, indent=2), encoding='utf-8')
+                temporary.replace(self.ready_file)
+            except OSError:
+                pass
+        self.ready.set()
+
+@st.cache_resource
+def get_cache_warmer():
+    """Start the process-wide warm-up, detached from any session, at `--serve` boot or on the first run"""
+    return CacheWarmer(cache_warm_steps()).start()
+
+# Static export: read-only pages rendered once to HTML + JSON for a plain file server
+STATIC_PAGES = {
+    "🏠 Project Overview": "index.html",
+    "🛠️ MCP Tools Explorer": "tools.html",
+    "📊 Testing Dashboard": "dashboard.html",
+    "📚 Documentation Hub": "docs.html"
+}
+
+STATIC_BASE_CSS = """
+<style>
+    body { font-family: -apple-system, "Segoe UI", Roboto, sans-serif; margin: 0; color: #262730; }
+    nav { background: #f0f2f6; padding: 0.8rem 2rem; display: flex; gap: 1.5rem; flex-wrap: wrap; }
+    nav a { color: #262730; text-decoration: none; }
+    nav a.active { font-weight: bold; }
+    main { max-width: 1200px; margin: 0 auto; padding: 1rem 2rem 3rem; }
+    .metric-row { display: grid; grid-template-columns: repeat(4, 1fr); gap: 1rem; }
+    .chart-row { display: grid; grid-template-columns: 1fr 1fr; gap: 1rem; }
+    .callout { background: #e8f4fd; border-radius: 0.5rem; padding: 0.8rem 1rem; }
+    table { border-collapse: collapse; width: 100%; }
+    th, td { border-bottom: 1px solid #e6e6e6; padding: 4px 8px; text-align: left; }
+    details.tool-details { margin: -0.5rem 0 1.5rem; }
+    pre { white-space: pre-wrap; background: #f8f9fa; padding: 0.8rem; border-radius: 4px; }
+</style>
+"""
+
+def markdown_to_html(text):
+    """Render markdown with the optional `markdown` package, else as preformatted text"""
+    import html
+    import textwrap
+    
+    text = textwrap.dedent(text).strip()
+    try:
+        import markdown
+    except ImportError:
+        return f"<pre>{html.escape(text)}</pre>"
+    return markdown.markdown(text, extensions=['tables', 'fenced_code'])
+
+def static_page(title, body, head="", root=""):
+    """Wrap a pre-rendered page body with the shared navigation and styles"""
+    import html
+    
+    nav = "".join(
+        f'<a href="{root}{filename}" class="{"active" if page == title else ""}">{html.escape(page)}</a>'
+        for page, filename in STATIC_PAGES.items()
+    )
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{html.escape(title)} · Habu MCP Server</title>
+{STATIC_BASE_CSS}{SHOWCASE_CSS}{head}
+</head>
+<body>
+<nav>{nav}</nav>
+<main>
+<h1 class="main-header">Habu MCP Server Project Overview</h1>
+{body}
+</main>
+</body>
+</html>
+"""
+
+def tool_details_html(tool_name, status_info):
+    """Static counterpart of the Details panel (tool_details_blocks)"""
+    import html
+    
+    record = get_tool_catalog().get(tool_name)
+    tool_info = record if record is not None and (record.detailed or record.on_server) else {}
+    
+    def bullets(items, code=False):
+        return "<ul>" + "".join(f"<li><code>{html.escape(str(item))}</code></li>" if code else f"<li>{item}</li>"
+                                for item in items) + "</ul>"
+    
+    sections = [
+        "<h4>📊 Testing Status</h4>"
+        f"<p><strong>Status:</strong> {status_info['status']}<br>"
+        f"<strong>Category:</strong> {status_info['status_category'].title()}<br>"
+        f"<strong>Issues:</strong> {status_info.get('issues', 'None')}<br>"
+        f"<strong>Priority:</strong> {status_info.get('priority', 'Not set')}</p>"
+    ]
+    if tool_info.get('description'):
+        sections.append(f"<h4>📖 What This Tool Does</h4><div class=\"callout\">{tool_info['description']}</div>")
+    for key, heading, code in [('primary_api_calls', "🔌 API Calls", True), ('key_features', "⚡ Key Features", False),
+                               ('workflow_steps', "🔄 Workflow Steps", False), ('use_cases', "🎯 Use Cases", False),
+                               ('parameters', "🧩 Parameters", True)]:
+        if tool_info.get(key):
+            sections.append(f"<h4>{heading}</h4>{bullets(tool_info[key], code)}")
+    if tool_info.get('response_format'):
+        sections.append(f"<h4>📄 Response Format</h4><pre>{html.escape(tool_info['response_format'])}</pre>")
+    
+    if 'detailed_status' in status_info:
+        sections.append(f"<h4>🧪 Testing Details</h4><div class=\"callout\">{status_info['detailed_status']}</div>")
+    for key, heading in [('working_components', "✅ Working Components"), ('current_issues', "❌ Current Issues")]:
+        if status_info.get(key):
+            sections.append(f"<h4>{heading}</h4>{bullets(status_info[key])}")
+    if 'technical_details' in status_info:
+        sections.append(f"<h4>🔍 Technical Testing Details</h4><pre>{html.escape(status_info['technical_details'])}</pre>")
+    if status_info.get('next_steps'):
+        sections.append(f"<h4>🎯 Next Steps</h4>{bullets(status_info['next_steps'])}")
+    return "".join(sections)
+
+def export_static_site(directory):
+    """Pre-render Overview, Tools Explorer, Testing Dashboard and Documentation Hub
+    
+    Writes one HTML file per page plus the data behind it under data/*.json,
+    using the same parsers and caches as the live app. Returns the written paths.
+    """
+    import html
+    from plotly.offline import get_plotlyjs
+    
+    output = Path(directory)
+    (output / "data").mkdir(parents=True, exist_ok=True)
+    (output / "docs").mkdir(exist_ok=True)
+    written = []
+    
+    def write(name, text):
+        path = output / name
+        path.write_text(text, encoding='utf-8')
+        written.append(path)
+    
+    def write_json(name, data):
+        # Frozen records come back as plain objects; anything else (timestamps) as text
+        write(f"data/{name}", json.dumps(data, indent=2,
+                                         default=lambda value: dict(value) if isinstance(value, MappingProxyType) else str(value)))
+    
+    snapshot = get_status_snapshot()
+    categories = get_tool_categories()
+    catalog = get_tool_catalog()
+    
+    # Project Overview
+    update_info = get_file_update_info()
+    metrics = overview_metrics(snapshot)
+    write("index.html", static_page("🏠 Project Overview", f"""
+<h2>🏠 Project Overview</h2>
+<h3>📊 Live Project Status</h3>
+<p><strong>Last Updated:</strong> {update_info['last_updated']} · <strong>Testing File:</strong> {update_info['testing_status_size']} lines ·
+<strong>Progress File:</strong> {update_info['progress_size']} lines · <strong>Total Docs:</strong> {update_info['total_docs']} files</p>
+<div class="metric-row">{"".join(f'<div class="success-metric"><h3>{value}</h3><p>{label}</p></div>' for value, label in metrics)}</div>
+<hr>
+<h3>🎯 What We've Built</h3>
+{markdown_to_html(OVERVIEW_INTRO)}
+<h3>🏆 Key Achievements</h3>
+{markdown_to_html(chr(10).join(f"- {achievement}" for achievement in KEY_ACHIEVEMENTS))}
+<h3>📊 Current Status: Built but Minimally Tested</h3>
+<div class="callout">{markdown_to_html(STATUS_REALITY_CHECK)}</div>
+"""))
+    write_json("overview.json", {'update_info': update_info, 'metrics': metrics,
+                                 'achievements': KEY_ACHIEVEMENTS})
+    
+    # Tools Explorer: every card with its details expanded inline
+    cards, tools = [], []
+    for category, category_tools in categories.items():
+        cards.append(f"<h3>📁 {html.escape(category)}</h3>")
+        for tool in category_tools:
+            status_info = snapshot.status_lookup.get(tool, UNTESTED_STATUS)
+            record = catalog.lookup(tool)
+            cards.append(tool_card_html(tool, status_info, record))
+            cards.append(f'<details class="tool-details"><summary>📖 Details</summary>'
+                         f'{tool_details_html(tool, status_info)}</details>')
+            tools.append(dict({slot: getattr(record, slot) for slot in ToolInfo.__slots__
+                               if slot not in ('badges_html', 'description_preview', 'key_features_text', 'api_text')},
+                              category=category, status=status_info))
+    write("tools.html", static_page("🛠️ MCP Tools Explorer",
+                                    f"<h2>🛠️ MCP Tools Explorer</h2><p>All {len(tools)} workflow tools organized by category</p>"
+                                    + "".join(cards)))
+    write_json("tools.json", tools)
+    write_json("status.json", {'tool_status': snapshot.tool_status, 'completed_tools': snapshot.completed_tools,
+                               'fingerprint': snapshot.fingerprint})
+    
+    # Testing Dashboard: plotly.js is written once next to the pages
+    data_key = testing_data_key(snapshot)
+    frames = get_testing_frames(*data_key, _snapshot=snapshot)
+    status_figure, category_figure = get_dashboard_figures(*data_key, _snapshot=snapshot)
+    write("plotly.min.js", get_plotlyjs())
+    status_counts = frames.status_counts
+    total_count = len(frames.tools)
+    verified_count = int(status_counts.get('verified', 0))
+    write("dashboard.html", static_page("📊 Testing Dashboard", f"""
+<h2>📊 Testing Dashboard</h2>
+<div class="chart-row">
+<div><h3>📈 Testing Progress</h3>{status_figure.to_html(full_html=False, include_plotlyjs=False)}</div>
+<div><h3>📊 Progress by Category</h3>{category_figure.to_html(full_html=False, include_plotlyjs=False)}</div>
+</div>
+<h3>🎯 Key Metrics</h3>
+<div class="metric-row">
+<div class="success-metric"><h3>{verified_count}/{total_count}</h3><p>Tools Verified ({verified_count / total_count * 100 if total_count else 0:.1f}%)</p></div>
+<div class="success-metric"><h3>{int(status_counts.get('partial', 0))}</h3><p>Partial Testing</p></div>
+<div class="success-metric"><h3>{int(status_counts.get('issue', 0))}</h3><p>Issues Found</p></div>
+</div>
+<h3>📋 Detailed Testing Status</h3>
+{frames.tools.to_html(index=False, border=0)}
+""", head='<script src="plotly.min.js"></script>'))
+    write_json("dashboard.json", {
+        'tools': frames.tools.to_dict(orient='records'),
+        'status_counts': {status: int(count) for status, count in status_counts.items()},
+        'category_status': {category: {status: int(count) for status, count in row.items()}
+                            for category, row in frames.category_status.iterrows()},
+        'figures': {'status': json.loads(status_figure.to_json()), 'category': json.loads(category_figure.to_json())}
+    })
+    
+    # Documentation Hub: each available document rendered to its own page
+    sections, documents = [], []
+    for section, docs in DOCUMENTATION_SECTIONS.items():
+        items = []
+        for filename, description in docs.items():
+            page = None
+            if Path(filename).is_file():
+                page = "docs/" + re.sub(r'[^\w.-]', '_', filename).lstrip('.') + ".html"
+                write(page, static_page("📚 Documentation Hub", f"<h2>📄 {html.escape(filename)}</h2>"
+                                        + markdown_to_html(load_markdown_file(filename)), root="../"))
+            documents.append({'section': section, 'filename': filename, 'description': description, 'page': page})
+            link = f'<a href="{page}">📖 View</a>' if page else "<em>not available</em>"
+            items.append(f"<li><strong>{html.escape(filename)}</strong> — <em>{description}</em> · {link}</li>")
+        sections.append(f"<h3>{section}</h3><ul>{''.join(items)}</ul>")
+    write("docs.html", static_page("📚 Documentation Hub",
+                                   "<h2>📚 Documentation Hub</h2><p>Access all critical project documents</p>" + "".join(sections)))
+    write_json("docs.json", documents)
+    
+    write_json("manifest.json", {
+        'generated': datetime.now().isoformat(timespec='seconds'),
+        'status_fingerprint': snapshot.fingerprint,
+        'pages': STATIC_PAGES,
+        'files': [str(path.relative_to(output)) for path in written]
+    })
+    return written
+
+def measure_imports(modules, after=()):
+    """Run `python -X importtime` in a fresh interpreter
+    
+    Returns (module, self us, cumulative us, parent module) rows in import order;
+    parent is None for the statements run directly.
+    """
+    import subprocess
+    
+    statements = [f"import {module}" for module in list(after) + list(modules)]
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "; ".join(statements)],
+        capture_output=True, text=True, cwd=str(Path(__file__).resolve().parent)
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    
+    entries = []
+    for line in result.stderr.splitlines():
+        match = re.match(r'import time:\s+(\d+)\s*\|\s*(\d+)\s*\|( +)(\S+)', line)
+        if match:
+            entries.append((match.group(4), int(match.group(1)), int(match.group(2)), len(match.group(3))))
+    
+    # importtime prints children before their parent; walk backwards to find parents
+    rows, stack = [], []
+    for name, self_us, cumulative_us, depth in reversed(entries):
+        while stack and stack[-1][1] >= depth:
+            stack.pop()
+        rows.append((name, self_us, cumulative_us, stack[-1][0] if stack else None))
+        stack.append((name, depth))
+    return rows[::-1]
+
+def profile_imports():
+    """Cold import cost of the showcase module, per top-level package, and of each page's lazy imports"""
+    showcase = Path(__file__).stem
+    packages = {}
+    for name, self_us, cumulative_us, parent in measure_imports([showcase]):
+        top = name.split('.')[0]
+        self_total, cumulative_total = packages.get(top, (0, 0))
+        # Cumulative time counts only where another package pulled this one in
+        if parent is None or parent.split('.')[0] != top:
+            cumulative_total += cumulative_us
+        packages[top] = (self_total + self_us, cumulative_total)
+    
+    pages = {}
+    for page, page_modules in PAGE_IMPORTS.items():
+        # Only what the page adds on top of an already imported showcase
+        pages[page] = sum(cumulative_us for name, _, cumulative_us, parent in measure_imports(page_modules, after=[showcase])
+                          if parent is None and name in page_modules) / 1000
+    return {
+        'modules': sorted(((name, self_us, cumulative_us) for name, (self_us, cumulative_us) in packages.items()),
+                          key=lambda row: row[2], reverse=True),
+        'pages': pages,
+        'startup_ms': packages.get(showcase, (0, 0))[1] / 1000
+    }
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    import argparse
+    parser = argparse.ArgumentParser(description="Habu MCP Server Showcase")
+    parser.add_argument('--build-catalog', metavar='PATH', nargs='?', const=str(CATALOG_ARTIFACT_PATH),
+                        help="compile the tool catalog artifact and exit")
+    parser.add_argument('--export', metavar='DIR',
+                        help="pre-render the read-only pages to static HTML + JSON in DIR and exit")
+    parser.add_argument('--warm', action='store_true',
+                        help="build the on-disk parse cache and catalog artifact, report timings and exit")
+    parser.add_argument('--serve', action='store_true',
+                        help="start the Streamlit server (remaining options are passed to `streamlit run`) "
+                             "and warm its caches at boot, writing the readiness file when done")
+    parser.add_argument('--import-profile', action='store_true',
+                        help="report cold import cost per module (python -X importtime) and exit")
+    args, extra_args = parser.parse_known_args()
+    if args.build_catalog:
+        rows = build_tool_catalog(args.build_catalog)
+        print(f"Compiled {len(rows)} tools into {args.build_catalog}")
+    elif args.export:
+        written = export_static_site(args.export)
+        print(f"Exported {len(written)} files to {args.export}")
+    elif args.warm:
+        # Pre-start step: the server's own warm-up then reads from disk;
+        # readiness is only reported by the server
+        warmer = CacheWarmer(cache_warm_steps(), ready_file=None)
+        warmer.run()
+        for name, seconds in warmer.timings.items():
+            print(f"{name:<20}{seconds * 1000:>10.1f} ms" + (f"  FAILED: {warmer.errors[name]}" if name in warmer.errors else ""))
+    elif args.import_profile:
+        report = profile_imports()
+        print(f"{'module':<32}{'self ms':>10}{'cumulative ms':>16}")
+        for name, self_us, cumulative_us in report['modules'][:25]:
+            print(f"{name:<32}{self_us / 1000:>10.1f}{cumulative_us / 1000:>16.1f}")
+        print()
+        for page, cost_ms in report['pages'].items():
+            print(f"{page}: +{cost_ms:.1f} ms on first visit")
+        print(f"Showcase module import: {report['startup_ms']:.1f} ms")
+    elif args.serve:
+        from streamlit.web import cli as streamlit_cli
+        # The server runs in this process and executes this file as __main__,
+        # so its script runs get this same warmer from st.cache_resource
+        get_cache_warmer()
+        sys.argv = ['streamlit', 'run', str(Path(__file__).resolve()), *extra_args]
+        sys.exit(streamlit_cli.main())
+    else:
+        main()
\ No newline at end of file